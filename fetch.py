@@ -1,14 +1,24 @@
 import os
 import csv
+import hashlib
+import heapq
+import json
 import logging
 import argparse
+import asyncio
+import random
+import sqlite3
+import sys
 import time
+from collections import defaultdict
+from copy import copy
 from dataclasses import dataclass, field
-from datetime import datetime
+from datetime import datetime, timezone
 from enum import Enum
-from functools import wraps
+from functools import lru_cache, wraps
+from operator import itemgetter
 from pathlib import Path
-from typing import Any, Dict, List, Optional, TypedDict, Union, Callable
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional, Set, Tuple, TypedDict, Union, Callable
 
 # Configure logging
 logging.basicConfig(
@@ -33,6 +43,13 @@ class TokenValidationError(GitHubAPIError):
 
 class RateLimitError(GitHubAPIError):
     """Exception raised when GitHub API rate limit is reached."""
+    
+    def __init__(self, message: str, retry_after: Optional[float] = None):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+class RequestTimeoutError(GitHubAPIError):
+    """Exception raised when a GitHub API request times out."""
     pass
 
 # Enums
@@ -45,13 +62,13 @@ class ReviewState(str, Enum):
     PENDING = "PENDING"
 
 # Data models with proper typing
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Comment:
     """Represents a GitHub PR comment."""
     body: str
     created_at: datetime
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Review:
     """Represents a GitHub PR review."""
     state: str
@@ -61,7 +78,7 @@ class Review:
     author: str
     comments: List[Comment] = field(default_factory=list)
 
-@dataclass
+@dataclass(slots=True)
 class PRWithReviews:
     """Represents a PR with its reviews."""
     title: str
@@ -72,19 +89,17 @@ class PRWithReviews:
 # TypedDict for PR data from API
 class GitHubPR(TypedDict, total=False):
     """TypedDict for GitHub PR data."""
-    id: str
     url: str
     title: str
-    state: str
-    createdAt: str
     updatedAt: str
+    author: Dict[str, str]
     additions: int
     deletions: int
     changedFiles: int
     comments: Dict[str, int]
     reviews: Dict[str, int]
 
-@dataclass
+@dataclass(slots=True)
 class TeamMemberSummary:
     """Summary of a team member's GitHub activity."""
     name: str
@@ -100,12 +115,16 @@ class TeamMemberSummary:
     all_prs: List[GitHubPR] = field(default_factory=list)  # All PRs
     all_reviewed_prs: List[PRWithReviews] = field(default_factory=list)  # All reviewed PRs
 
-import yaml
 from dotenv import load_dotenv
 from gql import Client, gql
-from gql.transport.httpx import HTTPXTransport
-from gql.transport.exceptions import TransportQueryError
+from gql.transport.httpx import HTTPXAsyncTransport
+from gql.transport.exceptions import TransportQueryError, TransportServerError
+from graphql import (
+    DocumentNode, ExecutionResult, NameNode, OperationDefinitionNode,
+    VariableNode, Visitor, print_ast, visit,
+)
 import httpx
+import orjson
 
 def load_environment():
     """Load environment variables from .env file."""
@@ -115,43 +134,377 @@ def load_environment():
         raise TokenValidationError("GITHUB_API_TOKEN environment variable is required")
     return github_token
 
+@lru_cache(maxsize=8192)
+def parse_timestamp(timestamp: str) -> datetime:
+    """Parse an ISO 8601 timestamp from the GitHub API.
+    
+    Python 3.11+ accepts the trailing 'Z' natively. Results are cached since
+    the same timestamps recur across review and comment pages.
+    
+    Args:
+        timestamp: ISO 8601 timestamp, e.g. '2024-07-01T12:00:00Z'
+        
+    Returns:
+        datetime: Timezone-aware datetime
+    """
+    return datetime.fromisoformat(timestamp)
+
 # Retry decorator for API calls
-def retry_on_error(max_retries: int = 3, retry_delay: int = 2):
-    """Decorator to retry functions on specific exceptions with exponential backoff."""
+def retry_on_error(max_retries: int = 3, retry_delay: float = 0.1):
+    """Decorator to retry coroutines on specific exceptions with jittered exponential backoff."""
+    def backoff(retries: int, retry_after: Optional[float] = None) -> float:
+        # Honor the server's Retry-After hint; otherwise jitter so concurrent
+        # workers don't all retry into the same rate limit window
+        if retry_after is not None:
+            return retry_after
+        base = retry_delay * (2 ** retries)
+        return base + random.random() * base
+    
     def decorator(func: Callable):
         @wraps(func)
-        def wrapper(*args, **kwargs):
+        async def wrapper(*args, **kwargs):
             retries = 0
+            last_error = None
             while retries < max_retries:
                 try:
-                    return func(*args, **kwargs)
+                    return await func(*args, **kwargs)
                 except RateLimitError as e:
-                    wait_time = retry_delay * (2 ** retries)
-                    logger.warning(f"Rate limit hit. Retrying in {wait_time}s... ({retries+1}/{max_retries})")
-                    time.sleep(wait_time)
+                    last_error = e
+                    wait_time = backoff(retries, e.retry_after)
+                    logger.warning(f"Rate limit hit. Retrying in {wait_time:.1f}s... ({retries+1}/{max_retries})")
+                    await asyncio.sleep(wait_time)
+                    retries += 1
+                except RequestTimeoutError as e:
+                    last_error = e
+                    wait_time = backoff(retries)
+                    logger.warning(f"{str(e)}. Retrying in {wait_time:.1f}s... ({retries+1}/{max_retries})")
+                    await asyncio.sleep(wait_time)
                     retries += 1
                 except TransportQueryError as e:
                     if "rate limit" in str(e).lower():
-                        wait_time = retry_delay * (2 ** retries)
-                        logger.warning(f"Rate limit hit. Retrying in {wait_time}s... ({retries+1}/{max_retries})")
-                        time.sleep(wait_time)
+                        last_error = e
+                        wait_time = backoff(retries)
+                        logger.warning(f"Rate limit hit. Retrying in {wait_time:.1f}s... ({retries+1}/{max_retries})")
+                        await asyncio.sleep(wait_time)
                         retries += 1
                     else:
                         raise GitHubAPIError(f"GitHub API error: {str(e)}")
                 except httpx.HTTPStatusError as e:
                     if e.response.status_code == 403 and "rate limit" in str(e).lower():
-                        wait_time = retry_delay * (2 ** retries)
-                        logger.warning(f"Rate limit hit. Retrying in {wait_time}s... ({retries+1}/{max_retries})")
-                        time.sleep(wait_time)
+                        last_error = e
+                        retry_after = e.response.headers.get('retry-after')
+                        wait_time = backoff(retries, float(retry_after) if retry_after else None)
+                        logger.warning(f"Rate limit hit. Retrying in {wait_time:.1f}s... ({retries+1}/{max_retries})")
+                        await asyncio.sleep(wait_time)
                         retries += 1
                     else:
                         raise GitHubAPIError(f"HTTP error: {str(e)}")
             
             # If we've exhausted retries, raise the last exception
-            raise GitHubAPIError(f"Failed after {max_retries} retries")
+            raise GitHubAPIError(f"Failed after {max_retries} retries: {str(last_error)}")
         return wrapper
     return decorator
 
+class TokenBucket:
+    """Async token bucket used to pace outgoing API requests."""
+    
+    def __init__(self, rate: float, capacity: int):
+        """Initialize the bucket.
+        
+        Args:
+            rate: Tokens added per second
+            capacity: Maximum number of tokens (burst size)
+        """
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = asyncio.Lock()
+    
+    def pause_for(self, seconds: float) -> None:
+        """Hold back all requests for the given number of seconds.
+        
+        Args:
+            seconds: How long to pause the bucket
+        """
+        self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+    
+    async def acquire(self) -> None:
+        """Wait until a token is available and take it."""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                if now < self._paused_until:
+                    await asyncio.sleep(self._paused_until - now)
+                    continue
+                
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+
+class AIMDLimiter:
+    """Async concurrency limit tuned by additive increase, multiplicative decrease.
+    
+    Every successful request raises the limit a little; every throttled
+    request cuts it, so concurrency settles just below what GitHub accepts.
+    """
+    
+    def __init__(self, initial: int, minimum: int, maximum: int,
+                 increase: float = 0.5, decrease: float = 0.5):
+        """Initialize the limiter.
+        
+        Args:
+            initial: Starting number of concurrent requests
+            minimum: Lowest the limit can drop to
+            maximum: Highest the limit can grow to
+            increase: Amount added to the limit after each success
+            decrease: Factor the limit is multiplied by after throttling
+        """
+        self.limit = float(initial)
+        self.minimum = minimum
+        self.maximum = maximum
+        self.increase = increase
+        self.decrease = decrease
+        self._in_flight = 0
+        self._condition = asyncio.Condition()
+    
+    def on_success(self) -> None:
+        """Grow the limit after a successful request."""
+        self.limit = min(self.maximum, self.limit + self.increase)
+    
+    def on_throttle(self) -> None:
+        """Shrink the limit after a throttled or failed request."""
+        self.limit = max(self.minimum, self.limit * self.decrease)
+        logger.debug(f"Throttled; concurrency limit now {int(self.limit)}")
+    
+    async def __aenter__(self) -> 'AIMDLimiter':
+        async with self._condition:
+            await self._condition.wait_for(lambda: self._in_flight < int(self.limit))
+            self._in_flight += 1
+        return self
+    
+    async def __aexit__(self, *exc_info) -> None:
+        async with self._condition:
+            self._in_flight -= 1
+            self._condition.notify_all()
+
+class ResponseCache:
+    """SQLite-backed on-disk cache of raw GraphQL responses."""
+    
+    def __init__(self, path: str = '.ghcache', refresh: bool = False, scope: str = ''):
+        """Initialize the cache.
+        
+        Args:
+            path: Path to the SQLite cache file
+            refresh: Ignore cached entries (fresh responses are still stored)
+            scope: Credential the responses were fetched with; entries are only
+                shared between runs using the same one
+        """
+        self.path = path
+        self.refresh = refresh
+        # Only a digest of the credential is mixed into keys, never the credential itself
+        self._scope = hashlib.blake2b(scope.encode(), digest_size=16).digest()
+        self._conn = None
+    
+    def _connection(self) -> sqlite3.Connection:
+        """Open the cache database on first use."""
+        if self._conn is None:
+            self._conn = sqlite3.connect(self.path)
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS responses "
+                "(key TEXT PRIMARY KEY, stored_at REAL NOT NULL, body TEXT NOT NULL)"
+            )
+        return self._conn
+    
+    def make_key(self, query_text: str, variables: Dict[str, Any]) -> str:
+        """Build a cache key from a query, its variables and the cache scope.
+        
+        Args:
+            query_text: GraphQL query source
+            variables: Query variables
+            
+        Returns:
+            str: Hex digest identifying the request
+        """
+        payload = self._scope + query_text.encode() + json.dumps(variables, sort_keys=True).encode()
+        return hashlib.blake2b(payload).hexdigest()
+    
+    def get(self, key: str, ttl: float) -> Optional[Dict[str, Any]]:
+        """Get a cached response if it is younger than ``ttl`` seconds.
+        
+        Args:
+            key: Cache key
+            ttl: Maximum age in seconds
+            
+        Returns:
+            Optional[Dict]: Cached response, or None on a miss
+        """
+        if self.refresh:
+            return None
+        row = self._connection().execute(
+            "SELECT stored_at, body FROM responses WHERE key = ?", (key,)
+        ).fetchone()
+        if row is None or time.time() - row[0] > ttl:
+            return None
+        return orjson.loads(row[1])
+    
+    def set(self, key: str, value: Dict[str, Any]) -> None:
+        """Store a response.
+        
+        Args:
+            key: Cache key
+            value: Response to store
+        """
+        conn = self._connection()
+        conn.execute(
+            "INSERT OR REPLACE INTO responses (key, stored_at, body) VALUES (?, ?, ?)",
+            (key, time.time(), orjson.dumps(value))
+        )
+        conn.commit()
+    
+    def close(self) -> None:
+        """Close the cache database."""
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+class LookbackState:
+    """JSON file of per-user watermarks and the results of earlier runs.
+    
+    Each entry holds the nodes a user's search returned and the latest
+    ``updatedAt`` among them, so later runs only ask GitHub for what changed
+    since then and merge it in.
+    """
+    
+    def __init__(self, path: str = '.lookback-state.json', full_refresh: bool = False):
+        """Initialize the state store.
+        
+        Args:
+            path: Path to the JSON state file
+            full_refresh: Ignore stored watermarks (the state is rebuilt from this run)
+        """
+        self.path = path
+        self.full_refresh = full_refresh
+        # Watermark for searches that found nothing: anything newer appears after this run started
+        self.started_at = datetime.now(timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ')
+        self._entries = None
+        self._dirty = False
+    
+    def _load(self) -> Dict[str, Any]:
+        """Read the state file on first use."""
+        if self._entries is None:
+            try:
+                with open(self.path, 'rb') as f:
+                    self._entries = orjson.loads(f.read())
+            except FileNotFoundError:
+                self._entries = {}
+            except orjson.JSONDecodeError:
+                logger.warning(f"Ignoring unreadable state file {self.path}")
+                self._entries = {}
+        return self._entries
+    
+    @staticmethod
+    def make_key(kind: str, username: str, repository: str,
+                 start_date: str, end_date: Optional[str]) -> str:
+        """Build the key identifying one user's search.
+        
+        Args:
+            kind: What was searched for ('prs' or 'reviews')
+            username: GitHub username
+            repository: Repository in format 'owner/repo'
+            start_date: Start date (YYYY-MM-DD)
+            end_date: Optional end date (YYYY-MM-DD)
+            
+        Returns:
+            str: State key
+        """
+        return f"{kind}:{repository}:{start_date}:{end_date or ''}:{username.lower()}"
+    
+    def watermark(self, key: str) -> Optional[str]:
+        """Get the latest ``updatedAt`` seen for a search.
+        
+        Args:
+            key: State key
+            
+        Returns:
+            Optional[str]: ISO 8601 timestamp, or None if the search must run in full
+        """
+        if self.full_refresh:
+            return None
+        entry = self._load().get(key)
+        return entry['watermark'] if entry else None
+    
+    def merge(self, key: str, nodes: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Merge freshly fetched nodes into the stored ones and advance the watermark.
+        
+        Nodes are matched by ``url``; fresh nodes replace stored ones.
+        
+        Args:
+            key: State key
+            nodes: Nodes returned by the incremental search
+            
+        Returns:
+            List[Dict]: The fresh nodes followed by stored nodes that did not change
+        """
+        merged = list(nodes)
+        if self.watermark(key):
+            fresh_urls = {node['url'] for node in nodes}
+            merged.extend(node for node in self._entries[key]['nodes'] if node['url'] not in fresh_urls)
+        self.store(key, merged)
+        return merged
+    
+    def store(self, key: str, nodes: List[Dict[str, Any]]) -> None:
+        """Replace the stored nodes for a search.
+        
+        A search that found nothing is stored with the time this run started
+        as its watermark, so it doesn't keep later runs from going incremental.
+        
+        Args:
+            key: State key
+            nodes: Every node the search now covers
+        """
+        self._load()[key] = {
+            'watermark': max((node['updatedAt'] for node in nodes), default=self.started_at),
+            'nodes': nodes,
+        }
+        self._dirty = True
+    
+    def discard(self, key: str) -> None:
+        """Forget a search, so the next run fetches its whole date range.
+        
+        Args:
+            key: State key
+        """
+        if self._load().pop(key, None) is not None:
+            self._dirty = True
+    
+    def stored_nodes(self, key: str) -> List[Dict[str, Any]]:
+        """Get the nodes stored for a search, unless running a full refresh.
+        
+        Args:
+            key: State key
+            
+        Returns:
+            List[Dict]: Stored nodes
+        """
+        if not self.watermark(key):
+            return []
+        return self._entries[key]['nodes']
+    
+    def save(self) -> None:
+        """Write the state file if anything changed."""
+        if not self._dirty:
+            return
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, 'wb') as f:
+            f.write(orjson.dumps(self._entries))
+        os.replace(tmp_path, self.path)
+        self._dirty = False
+
 # Load environment variables
 try:
     GITHUB_TOKEN = load_environment()
@@ -159,28 +512,97 @@ except TokenValidationError as e:
     logger.error(str(e))
     raise
 
+# Number of GraphQL requests in flight at once: start at the initial limit and
+# let AIMDLimiter adapt it between the minimum and maximum
+INITIAL_CONCURRENT_REQUESTS = 4
+MIN_CONCURRENT_REQUESTS = 1
+MAX_CONCURRENT_REQUESTS = 32
+
+# On-disk response cache location, and how long responses stay fresh (seconds).
+# Searches whose date window has already closed change rarely, so they live longer.
+# Repository lookups only confirm access, so a day-old answer is good enough.
+CACHE_PATH = '.ghcache'
+CACHE_TTL_RECENT = 10 * 60
+CACHE_TTL_HISTORICAL = 30 * 24 * 60 * 60
+CACHE_TTL_REPOSITORY = 24 * 60 * 60
+
+# Per-user watermarks and results kept between runs for incremental fetches
+STATE_PATH = '.lookback-state.json'
+
+# Number of CSV rows collected before writing them out in one call
+CSV_ROWS_PER_WRITE = 1000
+
+# Columns of the review export
+_CSV_HEADER = (
+    'pr_url',
+    'pr_title',
+    'review_date',
+    'review_state',
+    'review_body',
+    'comment_date',
+    'comment_body',
+)
+
+# Number of author: qualifiers combined into a single PR search, and the number
+# of results GitHub returns for any one search
+AUTHORS_PER_SEARCH = 5
+SEARCH_RESULT_LIMIT = 1000
+
+# Number of queries merged into a single aliased GraphQL request
+QUERIES_PER_BATCH = 10
+
+# Sustained request rate, and the share of the hourly point budget (with an
+# absolute floor) below which we wait for the reset rather than run out
+REQUESTS_PER_SECOND = 5
+RATE_LIMIT_RESERVE_FRACTION = 0.1
+RATE_LIMIT_RESERVE_MIN = 2
+
+# Seconds to wait for a single GraphQL request; slow searches are retried
+REQUEST_TIMEOUT = 30.0
+
 # GraphQL queries
+VIEWER_QUERY = """
+query {
+  viewer {
+    login
+  }
+}
+"""
+
+REPOSITORY_QUERY = """
+query ($owner: String!, $name: String!) {
+  repository(owner: $owner, name: $name) {
+    name
+  }
+}
+"""
+
+PR_FIELDS_FRAGMENT = """
+fragment PRFields on PullRequest {
+  url
+  title
+  updatedAt
+  author {
+    login
+  }
+  additions
+  deletions
+  changedFiles
+  comments {
+    totalCount
+  }
+  reviews {
+    totalCount
+  }
+}
+"""
+
 PR_QUERY = """
 query ($searchQuery: String!, $after: String) {
   search(query: $searchQuery, type: ISSUE, first: 100, after: $after) {
+    issueCount
     nodes {
-      ... on PullRequest {
-        id
-        url
-        title
-        state
-        createdAt
-        updatedAt
-        additions
-        deletions
-        changedFiles
-        comments {
-          totalCount
-        }
-        reviews {
-          totalCount
-        }
-      }
+      ...PRFields
     }
     pageInfo {
       hasNextPage
@@ -188,40 +610,63 @@ query ($searchQuery: String!, $after: String) {
     }
   }
 }
+""" + PR_FIELDS_FRAGMENT
+
+REVIEW_FIELDS_FRAGMENT = """
+fragment ReviewFields on PullRequestReview {
+  author {
+    login
+  }
+  state
+  createdAt
+  body
+  comments(first: 100) {
+    totalCount
+    nodes {
+      body
+      createdAt
+    }
+  }
+}
+"""
+
+# The same fields without review and comment bodies, for summaries that only count them
+REVIEW_COUNT_FIELDS_FRAGMENT = """
+fragment ReviewFields on PullRequestReview {
+  author {
+    login
+  }
+  state
+  createdAt
+  comments {
+    totalCount
+  }
+}
 """
 
-REVIEWS_QUERY = """
-query ($searchQuery: String!, $after: String, $reviewsAfter: String) {
-  search(query: $searchQuery, type: ISSUE, first: 25, after: $after) {
+# GitHub caps a query at 500,000 nodes: 100 PRs x 40 reviews x 100 comments
+# stays under it, and PRs with more than 40 reviews page through the rest.
+# Only submitted reviews are requested; PENDING drafts are left out server-side.
+REVIEWS_SEARCH = """
+query ($searchQuery: String!, $after: String) {
+  search(query: $searchQuery, type: ISSUE, first: 100, after: $after) {
     nodes {
       ... on PullRequest {
-        number
+        id
         title
         url
+        updatedAt
         author {
           login
         }
-        reviews(first: 100, after: $reviewsAfter) {
+        reviews(first: 40, states: [APPROVED, CHANGES_REQUESTED, COMMENTED, DISMISSED]) {
           totalCount
           pageInfo {
             hasNextPage
             endCursor
           }
           nodes {
-            id
-            author {
-              login
-            }
-            state
-            createdAt
-            body
-            comments(first: 100) {
-              totalCount
-              nodes {
-                body
-                createdAt
-              }
-            }
+            ...ReviewFields
           }
         }
       }
@@ -233,20 +678,108 @@ query ($searchQuery: String!, $after: String, $reviewsAfter: String) {
   }
 }
 """
+REVIEWS_QUERY_FULL = REVIEWS_SEARCH + REVIEW_FIELDS_FRAGMENT
+REVIEWS_QUERY_COUNTS = REVIEWS_SEARCH + REVIEW_COUNT_FIELDS_FRAGMENT
+
+# Follow-up review pages for a single PR, looked up by node ID
+PR_REVIEWS_PAGE = """
+query ($id: ID!, $reviewsAfter: String) {
+  node(id: $id) {
+    ... on PullRequest {
+      reviews(first: 100, after: $reviewsAfter, states: [APPROVED, CHANGES_REQUESTED, COMMENTED, DISMISSED]) {
+        totalCount
+        pageInfo {
+          hasNextPage
+          endCursor
+        }
+        nodes {
+          ...ReviewFields
+        }
+      }
+    }
+  }
+}
+"""
+PR_REVIEWS_PAGE_QUERY_FULL = PR_REVIEWS_PAGE + REVIEW_FIELDS_FRAGMENT
+PR_REVIEWS_PAGE_QUERY_COUNTS = PR_REVIEWS_PAGE + REVIEW_COUNT_FIELDS_FRAGMENT
+
+# Parsed once at import and reused for every request
+_VIEWER_QUERY_DOC = gql(VIEWER_QUERY)
+_REPOSITORY_QUERY_DOC = gql(REPOSITORY_QUERY)
+_PR_QUERY_DOC = gql(PR_QUERY)
+_REVIEWS_QUERY_FULL_DOC = gql(REVIEWS_QUERY_FULL)
+_REVIEWS_QUERY_COUNTS_DOC = gql(REVIEWS_QUERY_COUNTS)
+_PR_REVIEWS_PAGE_FULL_DOC = gql(PR_REVIEWS_PAGE_QUERY_FULL)
+_PR_REVIEWS_PAGE_COUNTS_DOC = gql(PR_REVIEWS_PAGE_QUERY_COUNTS)
+
+class OrjsonHTTPXAsyncTransport(HTTPXAsyncTransport):
+    """HTTPX async transport that decodes responses with orjson.
+    
+    Review payloads can run to several MB, where orjson parses noticeably
+    faster than the stdlib json module used by gql.
+    """
+    
+    def _prepare_result(self, response: httpx.Response) -> ExecutionResult:
+        """Decode a GraphQL response body.
+        
+        Args:
+            response: HTTP response from the GraphQL endpoint
+            
+        Returns:
+            ExecutionResult: Parsed GraphQL result
+        """
+        # Save latest response headers in transport
+        self.response_headers = response.headers
+        
+        try:
+            result = orjson.loads(response.content)
+        except orjson.JSONDecodeError:
+            self._raise_response_error(response, "Not a JSON answer")
+        
+        if not isinstance(result, dict) or ("errors" not in result and "data" not in result):
+            self._raise_response_error(response, 'No "data" or "errors" keys in answer')
+        
+        return ExecutionResult(
+            errors=result.get("errors"),
+            data=result.get("data"),
+            extensions=result.get("extensions"),
+        )
+
+class _SuffixVariables(Visitor):
+    """AST visitor renaming every ``$var`` to ``$var_{suffix}``."""
+    
+    def __init__(self, suffix: int):
+        super().__init__()
+        self.suffix = suffix
+    
+    def enter_variable(self, node: VariableNode, *_) -> VariableNode:
+        return VariableNode(name=NameNode(value=f"{node.name.value}_{self.suffix}"))
 
 class GitHubClient:
     """Class for handling GitHub API interactions."""
     
-    def __init__(self, token: str):
+    def __init__(self, token: str, max_concurrency: int = MAX_CONCURRENT_REQUESTS,
+                 cache: Optional[ResponseCache] = None):
         """Initialize the GitHub client.
         
         Args:
             token: GitHub API token
+            max_concurrency: Ceiling for the adaptive number of in-flight GraphQL requests
+            cache: Optional on-disk cache for query responses
         """
         self.token = token
+        self.cache = cache
         self.client = self._create_client()
+        self.session = None
+        self.concurrency = AIMDLimiter(
+            initial=min(INITIAL_CONCURRENT_REQUESTS, max_concurrency),
+            minimum=MIN_CONCURRENT_REQUESTS,
+            maximum=max_concurrency
+        )
+        self.rate_limiter = TokenBucket(rate=REQUESTS_PER_SECOND, capacity=INITIAL_CONCURRENT_REQUESTS)
+        self._batch_documents = {}  # Dict[tuple, DocumentNode], keyed by the ids of the batched documents
         
-    def _validate_token(self) -> str:
+    async def _validate_token(self) -> str:
         """Validate the GitHub token has required permissions.
         
         Returns:
@@ -256,50 +789,62 @@ class GitHubClient:
             TokenValidationError: If token validation fails
         """
         try:
-            response = httpx.post(
-                'https://api.github.com/graphql',
-                headers={'Authorization': f'Bearer {self.token}'},
-                json={'query': 'query { viewer { login } }'},
-                timeout=30.0
-            )
-            
-            if response.status_code != 200:
-                raise TokenValidationError(
-                    f"GitHub token validation failed: {response.status_code} {response.text}"
-                )
-                
-            username = response.json()['data']['viewer']['login']
+            result = await self.session.execute(_VIEWER_QUERY_DOC)
+            username = result['viewer']['login']
             logger.info(f"GitHub token validated successfully. Logged in as: {username}")
             return username
             
+        except TransportServerError as e:
+            raise TokenValidationError(f"GitHub token validation failed: {e.code} {str(e)}")
         except httpx.HTTPError as e:
             raise TokenValidationError(f"HTTP error during token validation: {str(e)}")
     
     def _create_client(self) -> Client:
         """Create an authenticated GitHub GraphQL client.
         
+        The underlying httpx.AsyncClient is shared by every request made
+        through this client, so concurrent queries reuse pooled connections.
+        
         Returns:
             Client: Configured GraphQL client
         """
-        transport = HTTPXTransport(
+        transport = OrjsonHTTPXAsyncTransport(
             url='https://api.github.com/graphql',
             headers={'Authorization': f'Bearer {self.token}'},
-            timeout=30.0
+            timeout=REQUEST_TIMEOUT,
+            http2=True,
+            limits=httpx.Limits(max_connections=20, max_keepalive_connections=10, keepalive_expiry=30),
+            event_hooks={'response': [self._track_rate_limit]}
         )
         
-        return Client(transport=transport, fetch_schema_from_transport=True)
+        # httpx enforces REQUEST_TIMEOUT, so disable gql's shorter default
+        return Client(transport=transport, fetch_schema_from_transport=False, execute_timeout=None)
+    
+    async def connect(self) -> None:
+        """Open the shared GraphQL session."""
+        if self.session is None:
+            self.session = await self.client.connect_async()
+    
+    async def close(self) -> None:
+        """Close the shared GraphQL session and the response cache."""
+        if self.session is not None:
+            await self.client.close_async()
+            self.session = None
+        if self.cache is not None:
+            self.cache.close()
     
     @retry_on_error()
-    def validate_and_connect(self) -> str:
+    async def validate_and_connect(self) -> str:
         """Validate token and ensure client is ready to use.
         
         Returns:
             str: GitHub username for the authenticated user
         """
-        return self._validate_token()
+        await self.connect()
+        return await self._validate_token()
     
     @retry_on_error()
-    def verify_repository(self, owner: str, name: str) -> str:
+    async def verify_repository(self, owner: str, name: str) -> str:
         """Verify that a repository exists and is accessible.
         
         Args:
@@ -312,29 +857,117 @@ class GitHubClient:
         Raises:
             RepositoryNotFoundError: If repository doesn't exist or is not accessible
         """
-        query = gql("""
-        query ($owner: String!, $name: String!) {
-          repository(owner: $owner, name: $name) {
-            name
-          }
-        }
-        """)
-        
         try:
-            result = self.client.execute(query, variable_values={"owner": owner, "name": name})
+            # Repository lookups are idempotent, so repeat runs answer from the cache
+            result = await self.execute_query(
+                _REPOSITORY_QUERY_DOC, {"owner": owner, "name": name}, CACHE_TTL_REPOSITORY
+            )
             repo_name = result['repository']['name']
             logger.info(f"Successfully connected to repository: {repo_name}")
             return repo_name
         except Exception as e:
             raise RepositoryNotFoundError(f"Error verifying repository access: {str(e)}")
     
-    @retry_on_error()
-    def execute_query(self, query, variables: Dict[str, Any] = None) -> Dict[str, Any]:
+    def _retry_after(self, response: Optional[httpx.Response] = None) -> Optional[float]:
+        """Get the Retry-After hint from a failed response, if any.
+        
+        The transport only remembers the headers of whichever request finished
+        last, so they are read only when the failing response is not available.
+        
+        Args:
+            response: HTTP response that caused the error, if available
+            
+        Returns:
+            Optional[float]: Seconds to wait, or None if the header is absent
+        """
+        headers = response.headers if response is not None else self.client.transport.response_headers
+        if headers is None or 'retry-after' not in headers:
+            return None
+        try:
+            return float(headers['retry-after'])
+        except ValueError:
+            return None
+    
+    @staticmethod
+    def _describe_error(error: TransportServerError, response: Optional[httpx.Response]) -> str:
+        """Describe an HTTP error, including GitHub's explanation when it sent one.
+        
+        Args:
+            error: Error raised by the transport
+            response: HTTP response that caused the error, if available
+            
+        Returns:
+            str: Error message
+        """
+        if response is None:
+            return str(error)
+        try:
+            detail = orjson.loads(response.content).get('message')
+        except (orjson.JSONDecodeError, AttributeError):
+            detail = response.text.strip()
+        status = f"{response.status_code} {response.reason_phrase}"
+        return f"{status}: {detail}" if detail else status
+    
+    @staticmethod
+    def _is_rate_limited(message: str, response: Optional[httpx.Response]) -> bool:
+        """Tell a rate limit 403 apart from other forbidden responses.
+        
+        GitHub also answers 403 for SAML enforcement and missing permissions,
+        which retrying cannot fix.
+        
+        Args:
+            message: Error message, including the response body
+            response: HTTP response that caused the error, if available
+            
+        Returns:
+            bool: True if the response signals rate limiting
+        """
+        if "rate limit" in message.lower():
+            return True
+        if response is None:
+            return False
+        return 'retry-after' in response.headers or response.headers.get('x-ratelimit-remaining') == '0'
+    
+    async def _track_rate_limit(self, response: httpx.Response) -> None:
+        """Pause the rate limiter when the remaining point budget runs low.
+        
+        Installed as an httpx response hook, so it sees the rate limit
+        headers GitHub sends on every response, errors included.
+        
+        Args:
+            response: HTTP response from the GraphQL endpoint
+        """
+        headers = response.headers
+        try:
+            remaining = int(headers['x-ratelimit-remaining'])
+            limit = int(headers['x-ratelimit-limit'])
+            reset = int(headers['x-ratelimit-reset'])
+        except (KeyError, ValueError):
+            return
+        
+        if remaining > max(RATE_LIMIT_RESERVE_MIN, limit * RATE_LIMIT_RESERVE_FRACTION):
+            return
+        
+        delay = reset - time.time()
+        if delay > 0:
+            logger.warning(f"Only {remaining} of {limit} rate limit points left. Pausing {delay:.0f}s until reset")
+            self.rate_limiter.pause_for(delay)
+    
+    @retry_on_error(max_retries=5)
+    async def execute_query(self, query, variables: Dict[str, Any] = None,
+                            cache_ttl: Optional[float] = None) -> Dict[str, Any]:
         """Execute a GraphQL query with variables.
         
+        The number of queries in flight adapts between MIN_CONCURRENT_REQUESTS
+        and ``max_concurrency``, backing off when GitHub throttles us, and
+        requests are paced by a token bucket so that concurrent fetches don't
+        trip GitHub's secondary rate limits.
+        
         Args:
             query: GraphQL query
             variables: Query variables
+            cache_ttl: Serve a cached response younger than this many seconds,
+                and cache the fresh response otherwise (None disables caching)
             
         Returns:
             Dict: Query result
@@ -342,14 +975,124 @@ class GitHubClient:
         Raises:
             GitHubAPIError: On query execution failure
         """
-        try:
-            return self.client.execute(query, variable_values=variables or {})
-        except TransportQueryError as e:
-            if "rate limit" in str(e).lower():
-                raise RateLimitError(f"GitHub API rate limit exceeded: {str(e)}")
-            raise GitHubAPIError(f"GraphQL query failed: {str(e)}")
-        except Exception as e:
-            raise GitHubAPIError(f"Error executing query: {str(e)}")
+        cache_key = None
+        if self.cache is not None and cache_ttl is not None:
+            query_text = query.loc.source.body if query.loc else print_ast(query)
+            cache_key = self.cache.make_key(query_text, variables or {})
+            cached = self.cache.get(cache_key, cache_ttl)
+            if cached is not None:
+                return cached
+        
+        async with self.concurrency:
+            await self.rate_limiter.acquire()
+            try:
+                result = await self.session.execute(query, variable_values=variables or {})
+            except TransportQueryError as e:
+                if "rate limit" in str(e).lower():
+                    self.concurrency.on_throttle()
+                    raise RateLimitError(f"GitHub API rate limit exceeded: {str(e)}", self._retry_after())
+                raise GitHubAPIError(f"GraphQL query failed: {str(e)}")
+            except TransportServerError as e:
+                response = e.__cause__.response if isinstance(e.__cause__, httpx.HTTPStatusError) else None
+                message = self._describe_error(e, response)
+                if e.code == 429 or (e.code == 403 and self._is_rate_limited(message, response)):
+                    self.concurrency.on_throttle()
+                    retry_after = self._retry_after(response)
+                    if retry_after is not None:
+                        self.rate_limiter.pause_for(retry_after)
+                    raise RateLimitError(f"GitHub API rate limit exceeded: {message}", retry_after)
+                if e.code is not None and e.code >= 500:
+                    self.concurrency.on_throttle()
+                raise GitHubAPIError(f"Error executing query: {message}")
+            except (TimeoutError, httpx.TimeoutException):
+                self.concurrency.on_throttle()
+                raise RequestTimeoutError(f"Query timed out after {REQUEST_TIMEOUT:.0f}s")
+            except Exception as e:
+                raise GitHubAPIError(f"Error executing query: {str(e)}")
+            
+            self.concurrency.on_success()
+            if cache_key is not None:
+                self.cache.set(cache_key, result)
+            return result
+    
+    @staticmethod
+    def _build_batch_document(documents: List[DocumentNode]) -> DocumentNode:
+        """Merge several single-operation queries into one aliased query.
+        
+        Query ``i`` has its variables renamed to ``$name_{i}`` and its
+        top-level fields aliased to ``b{i}_{field}``. Fragments are shared.
+        
+        Args:
+            documents: Parsed queries, each holding one operation
+            
+        Returns:
+            DocumentNode: Parsed batched query
+        """
+        variable_definitions = []
+        selections = []
+        fragments = {}
+        for i, document in enumerate(documents):
+            document = visit(document, _SuffixVariables(i))
+            for definition in document.definitions:
+                if not isinstance(definition, OperationDefinitionNode):
+                    fragments.setdefault(definition.name.value, definition)
+                    continue
+                variable_definitions.extend(definition.variable_definitions)
+                for selection in definition.selection_set.selections:
+                    selection = copy(selection)
+                    selection.alias = NameNode(value=f"b{i}_{(selection.alias or selection.name).value}")
+                    selections.append(selection)
+        
+        operation = copy(documents[0].definitions[0])
+        operation.name = None
+        operation.variable_definitions = tuple(variable_definitions)
+        operation.selection_set = copy(operation.selection_set)
+        operation.selection_set.selections = tuple(selections)
+        
+        # Re-parse from source so the document carries its text for cache keys
+        return gql(print_ast(DocumentNode(definitions=(operation, *fragments.values()))))
+    
+    async def execute_batch(self, queries: List[tuple], cache_ttl: Optional[float] = None,
+                            max_batch_size: int = QUERIES_PER_BATCH) -> List[Dict[str, Any]]:
+        """Execute several queries with as few requests as possible.
+        
+        Queries are merged, ``max_batch_size`` at a time, into aliased GraphQL
+        documents that are sent concurrently, and each response is split back
+        into one result per query.
+        
+        Args:
+            queries: (parsed query, variables) pairs; each query must have one operation
+            cache_ttl: Cache TTL in seconds for the responses (None disables caching)
+            max_batch_size: Maximum number of queries merged into one request
+            
+        Returns:
+            List[Dict]: Result of each query, in order, as if executed on its own
+        """
+        async def execute_chunk(chunk: List[tuple]) -> List[Dict[str, Any]]:
+            documents = [document for document, _ in chunk]
+            batch_key = tuple(map(id, documents))
+            cached = self._batch_documents.get(batch_key)
+            if cached is None:
+                # Keep the source documents alive so their ids are never reused
+                cached = (self._build_batch_document(documents), documents)
+                self._batch_documents[batch_key] = cached
+            
+            variables = {
+                f"{name}_{i}": value
+                for i, (_, query_variables) in enumerate(chunk)
+                for name, value in query_variables.items()
+            }
+            result = await self.execute_query(cached[0], variables, cache_ttl)
+            
+            results = [{} for _ in chunk]
+            for alias, value in result.items():
+                index, _, name = alias[1:].partition('_')
+                results[int(index)][name] = value
+            return results
+        
+        chunks = [queries[i:i + max_batch_size] for i in range(0, len(queries), max_batch_size)]
+        chunk_results = await asyncio.gather(*[execute_chunk(chunk) for chunk in chunks])
+        return [result for results in chunk_results for result in results]
 
 class TeamLoader:
     """Class for loading and validating team data."""
@@ -368,9 +1111,13 @@ class TeamLoader:
             FileNotFoundError: If team file doesn't exist
             ValueError: If team file has invalid format
         """
+        # Imported here so --help and argument errors don't pay for it
+        import yaml
+        
         try:
             with open(team_file, 'r') as f:
-                data = yaml.safe_load(f)
+                # Use the libyaml-backed loader when PyYAML was built with it
+                data = yaml.load(f, Loader=getattr(yaml, 'CSafeLoader', yaml.SafeLoader))
                 if not isinstance(data, dict) or 'team' not in data:
                     raise ValueError(f"Invalid team file format in {team_file}. Expected 'team' key with list value.")
                 
@@ -398,11 +1145,23 @@ class TeamLoader:
             raise ValueError(f"Invalid YAML in team file: {str(e)}")
     
     @staticmethod
-    def get_team_member(team_members: List[Dict[str, str]], github_username: str) -> Dict[str, str]:
-        """Get a team member by GitHub username.
+    def index_team_members(team_members: List[Dict[str, str]]) -> Dict[str, Dict[str, str]]:
+        """Index team members by GitHub username.
         
         Args:
             team_members: List of team members
+            
+        Returns:
+            Dict[str, Dict[str, str]]: Team member info keyed by GitHub username
+        """
+        return {member['github']: member for member in team_members}
+    
+    @staticmethod
+    def get_team_member(members_by_github: Dict[str, Dict[str, str]], github_username: str) -> Dict[str, str]:
+        """Get a team member by GitHub username.
+        
+        Args:
+            members_by_github: Team members indexed by ``index_team_members``
             github_username: GitHub username to look for
             
         Returns:
@@ -411,24 +1170,59 @@ class TeamLoader:
         Raises:
             ValueError: If team member not found
         """
-        member = next((m for m in team_members if m['github'] == github_username), None)
-        if not member:
+        try:
+            return members_by_github[github_username]
+        except KeyError:
             raise ValueError(f"User {github_username} not found in team data")
-        return member
+    
+    @staticmethod
+    @lru_cache(maxsize=8)
+    def _load_team_index(team_file: str, mtime: float) -> Dict[str, Dict[str, str]]:
+        """Load and index a team file, parsing it once per modification time.
+        
+        Args:
+            team_file: Path to team YAML file
+            mtime: Modification time of the file, so edits invalidate the cache
+            
+        Returns:
+            Dict[str, Dict[str, str]]: Team member info keyed by GitHub username
+        """
+        return TeamLoader.index_team_members(TeamLoader.load_team_members(team_file))
+    
+    @staticmethod
+    def get_single_member(team_file: str, github_username: str) -> Dict[str, str]:
+        """Load one team member from a team file.
+        
+        Args:
+            team_file: Path to team YAML file
+            github_username: GitHub username to look for
+            
+        Returns:
+            Dict[str, str]: Team member info
+            
+        Raises:
+            FileNotFoundError: If team file doesn't exist
+            ValueError: If team file has invalid format or the member isn't in it
+        """
+        try:
+            mtime = os.stat(team_file).st_mtime
+        except FileNotFoundError:
+            logger.error(f"Team file not found: {team_file}")
+            raise
+        return TeamLoader.get_team_member(TeamLoader._load_team_index(team_file, mtime), github_username)
 
 class GitHubDataFetcher:
     """Class for fetching and processing GitHub data."""
     
-    def __init__(self, github_client: GitHubClient):
+    def __init__(self, github_client: GitHubClient, state: Optional[LookbackState] = None):
         """Initialize with a GitHub client.
         
         Args:
             github_client: Authenticated GitHub client
+            state: Optional watermark store enabling incremental fetches
         """
         self.github_client = github_client
-        # Compile GraphQL queries
-        self.pr_query = gql(PR_QUERY)
-        self.reviews_query = gql(REVIEWS_QUERY)
+        self.state = state
     
     def _build_date_filter(self, field: str, start_date: str, end_date: Optional[str] = None) -> str:
         """Build a date filter string for GitHub search queries.
@@ -446,157 +1240,555 @@ class GitHubDataFetcher:
             date_filter += f" {field}:<={end_date}"
         return date_filter
     
-    def _paginate_results(self, query_func: Callable, max_pages: int = 5) -> List[Dict]:
-        """Generic pagination handler for GitHub GraphQL queries.
+    @staticmethod
+    def _updated_since(watermark: str) -> str:
+        """Build a search qualifier matching items updated since a watermark.
         
         Args:
-            query_func: Function that takes cursor and returns (items, has_next, cursor)
-            max_pages: Maximum number of pages to fetch
+            watermark: ISO 8601 timestamp as returned by GitHub
+            
+        Returns:
+            str: ``updated:>=`` search qualifier
+        """
+        return f"updated:>={watermark.replace('Z', '+00:00')}"
+    
+    @staticmethod
+    def _cache_ttl(end_date: Optional[str]) -> float:
+        """Pick how long cached responses stay fresh for a date window.
+        
+        Args:
+            end_date: Optional end date (YYYY-MM-DD)
+            
+        Returns:
+            float: Cache TTL in seconds
+        """
+        if end_date and end_date < datetime.now(timezone.utc).strftime('%Y-%m-%d'):
+            return CACHE_TTL_HISTORICAL
+        return CACHE_TTL_RECENT
+    
+    async def _fetch_first_pages(self, search_queries: List[str], cache_ttl: float) -> List[Dict]:
+        """Fetch the first page of several PR searches, batched via aliases.
+        
+        Args:
+            search_queries: GitHub search query strings
+            cache_ttl: Cache TTL in seconds for the responses
             
         Returns:
-            List[Dict]: Aggregated results from all pages
+            List[Dict]: The ``search`` result for each query, in order
+        """
+        results = await self.github_client.execute_batch(
+            [(_PR_QUERY_DOC, {"searchQuery": search_query}) for search_query in search_queries],
+            cache_ttl
+        )
+        return [result['search'] for result in results]
+    
+    async def _iter_pages(self, query_func: Callable, max_pages: int = 5,
+                          start_cursor: Optional[str] = None,
+                          on_truncated: Optional[Callable[[], None]] = None) -> AsyncIterator[List[Dict]]:
+        """Generic pagination handler for GitHub GraphQL queries, yielding page by page.
+        
+        Args:
+            query_func: Coroutine function that takes cursor and returns (items, has_next, cursor)
+            max_pages: Maximum number of pages to fetch
+            start_cursor: Cursor to resume from when earlier pages were already fetched
+            on_truncated: Called if ``max_pages`` runs out while more pages remain
+            
+        Yields:
+            List[Dict]: Items from each page
         """
-        results = []
         has_next_page = True
-        cursor = None
+        cursor = start_cursor
         page = 1
+        item_count = 0
         
         while has_next_page and page <= max_pages:
-            items, has_next_page, cursor = query_func(cursor)
-            results.extend(items)
+            items, has_next_page, cursor = await query_func(cursor)
+            item_count += len(items)
             page += 1
             if page % 2 == 0:  # Log progress every 2 pages
-                logger.info(f"Fetched {len(results)} items ({page-1}/{max_pages} pages)")
+                logger.info(f"Fetched {item_count} items ({page-1}/{max_pages} pages)")
+            yield items
+        
+        if has_next_page:
+            logger.warning(f"Stopped after {max_pages} pages with more results remaining; results are incomplete")
+            if on_truncated:
+                on_truncated()
+    
+    async def _paginate_results(self, query_func: Callable, reducer: Callable[[List[Dict]], None],
+                                max_pages: int = 5, start_cursor: Optional[str] = None) -> bool:
+        """Generic pagination handler for GitHub GraphQL queries.
+        
+        Each page is handed to ``reducer`` as it arrives, so pages can be
+        folded into the caller's results and discarded.
+        
+        Args:
+            query_func: Coroutine function that takes cursor and returns (items, has_next, cursor)
+            reducer: Callback consuming the items of each page
+            max_pages: Maximum number of pages to fetch
+            start_cursor: Cursor to resume from when earlier pages were already fetched
+            
+        Returns:
+            bool: False if ``max_pages`` ran out before the last page
+        """
+        truncated = []
+        async for items in self._iter_pages(query_func, max_pages, start_cursor, lambda: truncated.append(True)):
+            reducer(items)
+        return not truncated
+    
+    async def fetch_user_prs(self, github_username: str, repository: str = 'amperity/app', 
+                     start_date: str = '2024-07-01', end_date: str = None) -> List[GitHubPR]:
+        """Fetch all PRs authored by a user within a date range.
+        
+        Args:
+            github_username: GitHub username to fetch PRs for
+            repository: Repository in format 'owner/repo'
+            start_date: Start date (YYYY-MM-DD)
+            end_date: Optional end date (YYYY-MM-DD)
+            
+        Returns:
+            List[GitHubPR]: List of pull requests
+        """
+        prs_by_user = await self.fetch_team_prs([github_username], repository, start_date, end_date)
+        return prs_by_user[github_username]
+    
+    def _build_pr_searches(self, github_usernames: List[str], repository: str, start_date: str,
+                           end_date: Optional[str]) -> Tuple[List[str], Dict[str, str], Set[str]]:
+        """Build the search queries for PRs authored by several users.
+        
+        Authors are combined into one search per chunk of AUTHORS_PER_SEARCH
+        usernames.
+        
+        Args:
+            github_usernames: GitHub usernames to fetch PRs for
+            repository: Repository in format 'owner/repo'
+            start_date: Start date (YYYY-MM-DD)
+            end_date: Optional end date (YYYY-MM-DD)
+            
+        Returns:
+            Tuple: The search queries, each user's state key, and the users
+                whose searches only ask for changes since their watermark
+        """
+        # Build date filter
+        date_filter = self._build_date_filter('created', start_date, end_date)
+        
+        state_keys = {}
+        incremental = set()
+        search_queries = []
+        for i in range(0, len(github_usernames), AUTHORS_PER_SEARCH):
+            chunk = github_usernames[i:i + AUTHORS_PER_SEARCH]
+            search_query = (
+                f"is:pr repo:{repository} "
+                + " ".join(f"author:{username}" for username in chunk)
+                + f" {date_filter}"
+            )
+            
+            # Only ask for recent changes when every author in the search has a watermark
+            if self.state:
+                watermarks = []
+                for username in chunk:
+                    state_keys[username] = LookbackState.make_key('prs', username, repository, start_date, end_date)
+                    watermarks.append(self.state.watermark(state_keys[username]))
+                if all(watermarks):
+                    search_query += f" {self._updated_since(min(watermarks))}"
+                    incremental.update(chunk)
+            search_queries.append(search_query)
+        
+        return search_queries, state_keys, incremental
+    
+    def _build_review_search(self, github_username: str, repository: str, start_date: str,
+                             end_date: Optional[str], include_bodies: bool = True,
+                             incremental: bool = True) -> Tuple[str, str]:
+        """Build the search query for PRs a user reviewed.
+        
+        Args:
+            github_username: GitHub username to fetch reviews for
+            repository: Repository in format 'owner/repo'
+            start_date: Start date (YYYY-MM-DD)
+            end_date: Optional end date (YYYY-MM-DD)
+            include_bodies: Whether review and comment bodies are fetched
+            incremental: Whether to only search for changes since the saved watermark
+            
+        Returns:
+            Tuple[str, str]: The search query and the user's state key
+        """
+        # Build date filter, narrowed to PRs updated since the last run if we have one;
+        # results saved without bodies can't stand in for a run that needs them.
+        # The incremental search has no upper bound, so that saved PRs since updated
+        # past end_date come back and are dropped rather than replayed
+        kind = 'reviews' if include_bodies else 'review-counts'
+        state_key = LookbackState.make_key(kind, github_username, repository, start_date, end_date)
+        watermark = self.state.watermark(state_key) if self.state and incremental else None
+        if watermark:
+            date_filter = self._updated_since(watermark)
+        else:
+            date_filter = self._build_date_filter('updated', start_date, end_date)
+        return f"repo:{repository} is:pr reviewed-by:{github_username} {date_filter}", state_key
+    
+    async def fetch_team_activity(self, github_usernames: List[str], repository: str = 'amperity/app',
+                                  start_date: str = '2024-07-01', end_date: str = '2025-01-31',
+                                  include_bodies: bool = True) -> Tuple[Dict[str, List[GitHubPR]], Dict[str, List[PRWithReviews]]]:
+        """Fetch several users' authored PRs and reviews with as few requests as possible.
+        
+        The first pages of every authored-PR search and every reviewed-by
+        search are batched into aliased requests; only later pages need
+        requests of their own.
+        
+        Args:
+            github_usernames: GitHub usernames to fetch activity for
+            repository: Repository in format 'owner/repo'
+            start_date: Start date (YYYY-MM-DD)
+            end_date: End date (YYYY-MM-DD)
+            include_bodies: Whether to fetch review and comment bodies
+            
+        Returns:
+            Tuple: Pull requests and reviewed PRs, each keyed by GitHub username
+            
+        Raises:
+            GitHubAPIError: If any user's PRs or reviews could not be fetched
+        """
+        pr_searches, _, _ = self._build_pr_searches(github_usernames, repository, start_date, end_date)
+        review_searches = [
+            self._build_review_search(username, repository, start_date, end_date, include_bodies)[0]
+            for username in github_usernames
+        ]
+        
+        # Without bodies a review search is small enough to batch freely; with them its
+        # first page nears GitHub's node limit, so only one rides along with the PR searches
+        reviews_query = _REVIEWS_QUERY_FULL_DOC if include_bodies else _REVIEWS_QUERY_COUNTS_DOC
+        batched_reviews = len(review_searches) if not include_bodies else min(1, len(review_searches))
+        queries = [(_PR_QUERY_DOC, {"searchQuery": search_query}) for search_query in pr_searches]
+        queries.extend(
+            (reviews_query, {"searchQuery": search_query})
+            for search_query in review_searches[:batched_reviews]
+        )
+        results = await self.github_client.execute_batch(queries, self._cache_ttl(end_date))
+        pr_pages = [result['search'] for result in results[:len(pr_searches)]]
+        review_pages = [result['search'] for result in results[len(pr_searches):]]
+        review_pages.extend([None] * (len(github_usernames) - batched_reviews))
+        
+        prs_by_user, reviews_results = await asyncio.gather(
+            self.fetch_team_prs(github_usernames, repository, start_date, end_date, first_pages=pr_pages),
+            asyncio.gather(
+                *[
+                    self.fetch_user_reviews(username, repository, start_date, end_date,
+                                            first_page=first_page, include_bodies=include_bodies)
+                    for username, first_page in zip(github_usernames, review_pages)
+                ],
+                return_exceptions=True
+            )
+        )
         
-        return results
+        # Every review fetch has finished, so failing now leaves nothing running
+        for username, reviews in zip(github_usernames, reviews_results):
+            if isinstance(reviews, BaseException):
+                logger.error(f"Error fetching reviews for {username}: {str(reviews)}")
+                raise reviews
+        return prs_by_user, dict(zip(github_usernames, reviews_results))
     
-    def fetch_user_prs(self, github_username: str, repository: str = 'amperity/app', 
-                     start_date: str = '2024-07-01', end_date: str = None) -> List[GitHubPR]:
-        """Fetch all PRs authored by a user within a date range.
+    async def fetch_team_prs(self, github_usernames: List[str], repository: str = 'amperity/app',
+                             start_date: str = '2024-07-01', end_date: str = None,
+                             first_pages: Optional[List[Dict]] = None) -> Dict[str, List[GitHubPR]]:
+        """Fetch PRs authored by several users with as few searches as possible.
+        
+        Authors are combined into one search per chunk of AUTHORS_PER_SEARCH
+        usernames, the first pages of those searches are batched into aliased
+        requests, and the results are grouped by PR author.
         
         Args:
-            github_username: GitHub username to fetch PRs for
+            github_usernames: GitHub usernames to fetch PRs for
             repository: Repository in format 'owner/repo'
             start_date: Start date (YYYY-MM-DD)
             end_date: Optional end date (YYYY-MM-DD)
+            first_pages: First page of each search, if already fetched
             
         Returns:
-            List[GitHubPR]: List of pull requests
+            Dict[str, List[GitHubPR]]: Pull requests keyed by GitHub username
         """
-        logger.info(f"Fetching PRs authored by {github_username} in {repository} since {start_date}")
+        logger.info(f"Fetching PRs authored by {len(github_usernames)} users in {repository} since {start_date}")
         
-        # Build date filter
-        date_filter = self._build_date_filter('created', start_date, end_date)
-        search_query = f"is:pr repo:{repository} author:{github_username} {date_filter}"
+        search_queries, state_keys, incremental = self._build_pr_searches(
+            github_usernames, repository, start_date, end_date
+        )
+        cache_ttl = self._cache_ttl(end_date)
+        
+        # Fetch every search's first page in as few requests as possible
+        if first_pages is None:
+            first_pages = await self._fetch_first_pages(search_queries, cache_ttl)
+        
+        search_authors = [
+            github_usernames[i:i + AUTHORS_PER_SEARCH] for i in range(0, len(github_usernames), AUTHORS_PER_SEARCH)
+        ]
+        
+        # A shared search stops at SEARCH_RESULT_LIMIT results, so split any that
+        # matched more into one search per author
+        split_queries = []
+        split_authors = []
+        for i, (chunk, first_page) in enumerate(zip(search_authors, first_pages)):
+            if first_page['issueCount'] <= SEARCH_RESULT_LIMIT or len(chunk) == 1:
+                continue
+            logger.info(f"PR search for {', '.join(chunk)} matched {first_page['issueCount']} PRs; searching per author")
+            incremental.difference_update(chunk)
+            for username in chunk:
+                queries, _, author_incremental = self._build_pr_searches([username], repository, start_date, end_date)
+                split_queries.extend(queries)
+                split_authors.append([username])
+                incremental.update(author_incremental)
+            search_queries[i] = None
+        if split_queries:
+            split_pages = await self._fetch_first_pages(split_queries, cache_ttl)
+            kept = [
+                (query, chunk, page)
+                for query, chunk, page in zip(search_queries, search_authors, first_pages)
+                if query is not None
+            ]
+            search_queries = [query for query, _, _ in kept] + split_queries
+            search_authors = [chunk for _, chunk, _ in kept] + split_authors
+            first_pages = [page for _, _, page in kept] + split_pages
+        
+        # Group PRs by author as pages arrive; GitHub logins are case-insensitive
+        usernames_by_login = {username.lower(): username for username in github_usernames}
+        prs_by_user = defaultdict(list)
+        
+        def add_prs(prs: List[GitHubPR]) -> None:
+            for pr in prs:
+                author = pr.get('author') or {}
+                username = usernames_by_login.get(author.get('login', '').lower())
+                if username:
+                    prs_by_user[username].append(pr)
+        
+        truncated = set()
         
-        def query_page(cursor):
-            variables = {"searchQuery": search_query}
-            if cursor:
-                variables["after"] = cursor
+        async def fetch_remaining(search_query: str, chunk: List[str], first_page: Dict) -> None:
+            add_prs(first_page['nodes'])
+            if not first_page['pageInfo']['hasNextPage']:
+                return
             
-            result = self.github_client.execute_query(self.pr_query, variables)
+            async def query_page(cursor):
+                variables = {"searchQuery": search_query, "after": cursor}
+                result = await self.github_client.execute_query(_PR_QUERY_DOC, variables, cache_ttl)
+                
+                nodes = result['search']['nodes']
+                page_info = result['search']['pageInfo']
+                return nodes, page_info['hasNextPage'], page_info['endCursor']
             
-            nodes = result['search']['nodes']
-            page_info = result['search']['pageInfo']
-            return nodes, page_info['hasNextPage'], page_info['endCursor']
+            # GitHub search returns at most 1000 results (10 pages)
+            complete = await self._paginate_results(
+                query_page, add_prs, max_pages=9, start_cursor=first_page['pageInfo']['endCursor']
+            )
+            if not complete:
+                truncated.update(chunk)
         
-        prs = self._paginate_results(query_page, max_pages=5)
-        logger.info(f"Fetched {len(prs)} PRs for {github_username}")
-        return prs
-
-    def fetch_user_reviews(self, github_username: str, repository: str = 'amperity/app', 
-                        start_date: str = '2024-07-01', end_date: str = '2025-01-31') -> List[PRWithReviews]:
+        # Each author belongs to a single search, so their PRs stay in search order
+        await asyncio.gather(*[
+            fetch_remaining(search_query, chunk, first_page)
+            for search_query, chunk, first_page in zip(search_queries, search_authors, first_pages)
+        ])
+        
+        # Fold in PRs from earlier runs that have not changed since
+        for username, key in state_keys.items():
+            if username in incremental:
+                prs_by_user[username] = self.state.merge(key, prs_by_user[username])
+            else:
+                self.state.store(key, prs_by_user[username])
+            # The watermark would hide the PRs a truncated search missed, so start over next run
+            if username in truncated:
+                self.state.discard(key)
+        
+        for username in github_usernames:
+            logger.info(f"Fetched {len(prs_by_user[username])} PRs for {username}")
+        return prs_by_user
+    
+    async def fetch_user_reviews(self, github_username: str, repository: str = 'amperity/app', 
+                        start_date: str = '2024-07-01', end_date: str = '2025-01-31',
+                        first_page: Optional[Dict] = None, include_bodies: bool = True) -> List[PRWithReviews]:
         """Fetch all PR reviews authored by a user within a date range.
         
+        Only PRs updated since the saved watermark are searched for; the
+        rest are replayed from the saved state, which is then updated.
+        
         Args:
             github_username: GitHub username to fetch reviews for
             repository: Repository in format 'owner/repo'
             start_date: Start date (YYYY-MM-DD)
             end_date: End date (YYYY-MM-DD)
+            first_page: First page of the review search, if already fetched
+            include_bodies: Whether to fetch review and comment bodies
             
         Returns:
             List[PRWithReviews]: List of PRs with reviews
         """
         logger.info(f"Fetching reviews by {github_username} in {repository} from {start_date} to {end_date}")
         
-        reviews_by_pr = {}  # Dict[str, PRWithReviews]
+        search_query, state_key = self._build_review_search(
+            github_username, repository, start_date, end_date, include_bodies
+        )
+        seen_urls = set()
+        truncated = []
+        nodes = [
+            {
+                'title': pr['title'],
+                'url': pr['url'],
+                'updatedAt': pr['updatedAt'],
+                'reviews': author_reviews,
+            }
+            async for pr, author_reviews in self._iter_review_nodes(
+                search_query, github_username, self._cache_ttl(end_date), first_page, include_bodies, seen_urls,
+                on_truncated=lambda: truncated.append(True), updated_until=end_date
+            )
+        ]
+        
+        # Fold in PRs from earlier runs that have not changed since
+        if self.state:
+            nodes.extend(node for node in self.state.stored_nodes(state_key) if node['url'] not in seen_urls)
+            if truncated:
+                # The watermark would hide the PRs the search missed, so start over next run
+                self.state.discard(state_key)
+            else:
+                self.state.store(state_key, nodes)
         
-        # Build date filter
-        date_filter = self._build_date_filter('updated', start_date, end_date)
-        search_query = f"repo:{repository} is:pr reviewed-by:{github_username} {date_filter}"
+        logger.info(f"Fetched reviews from {len(nodes)} PRs for {github_username}")
+        return [self._build_pr_with_reviews(node, node['reviews'], github_username) for node in nodes]
+    
+    async def iter_user_reviews(self, github_username: str, repository: str = 'amperity/app', 
+                                start_date: str = '2024-07-01', end_date: str = '2025-01-31',
+                                include_bodies: bool = True) -> AsyncIterator[PRWithReviews]:
+        """Stream PR reviews authored by a user within a date range.
         
-        def query_page(cursor):
-            variables = {"searchQuery": search_query}
-            if cursor:
-                variables["after"] = cursor
-            
-            result = self.github_client.execute_query(self.reviews_query, variables)
+        Each PR is yielded as soon as all of its review pages have been
+        fetched, so callers never need to hold every review in memory. The
+        saved state is neither read nor updated, as replaying it would mean
+        holding every review.
+        
+        Args:
+            github_username: GitHub username to fetch reviews for
+            repository: Repository in format 'owner/repo'
+            start_date: Start date (YYYY-MM-DD)
+            end_date: End date (YYYY-MM-DD)
+            include_bodies: Whether to fetch review and comment bodies; without
+                them only dates, states and counts are filled in
             
-            # Process PRs from this page
-            for pr in result['search']['nodes']:
-                self._process_pr_reviews(pr, github_username, search_query, cursor, reviews_by_pr)
+        Yields:
+            PRWithReviews: A PR with the user's reviews on it
+        """
+        logger.info(f"Fetching reviews by {github_username} in {repository} from {start_date} to {end_date}")
+        
+        search_query, _ = self._build_review_search(
+            github_username, repository, start_date, end_date, include_bodies, incremental=False
+        )
+        pr_count = 0
+        async for pr, author_reviews in self._iter_review_nodes(
+            search_query, github_username, self._cache_ttl(end_date), None, include_bodies, set()
+        ):
+            pr_count += 1
+            yield self._build_pr_with_reviews(pr, author_reviews, github_username)
+        
+        logger.info(f"Fetched reviews from {pr_count} PRs for {github_username}")
+    
+    async def _iter_review_nodes(self, search_query: str, github_username: str, cache_ttl: float,
+                                 first_page: Optional[Dict], include_bodies: bool, seen_urls: Set[str],
+                                 on_truncated: Optional[Callable[[], None]] = None,
+                                 updated_until: Optional[str] = None) -> AsyncIterator[Tuple[Dict, List[Dict]]]:
+        """Page through a reviewed-by search, yielding each PR with the user's review nodes.
+        
+        Args:
+            search_query: GitHub search query string
+            github_username: GitHub username whose reviews to keep
+            cache_ttl: Cache TTL in seconds for the responses
+            first_page: First page of the search, if already fetched
+            include_bodies: Whether to fetch review and comment bodies
+            seen_urls: URLs of PRs already seen; every PR the search returns is added
+            on_truncated: Called if the search has more pages than are fetched
+            updated_until: Skip PRs updated after this date (YYYY-MM-DD); they are
+                still added to ``seen_urls``
             
-            page_info = result['search']['pageInfo']
-            return result['search']['nodes'], page_info['hasNextPage'], page_info['endCursor']
+        Yields:
+            Tuple[Dict, List[Dict]]: The PR node and the user's review nodes on it
+        """
+        reviews_query = _REVIEWS_QUERY_FULL_DOC if include_bodies else _REVIEWS_QUERY_COUNTS_DOC
         
-        # Paginate through all matching PRs
-        self._paginate_results(query_page, max_pages=10)
+        async def query_page(cursor):
+            if cursor is None and first_page is not None:
+                search = first_page
+            else:
+                variables = {"searchQuery": search_query}
+                if cursor:
+                    variables["after"] = cursor
+                
+                result = await self.github_client.execute_query(reviews_query, variables, cache_ttl)
+                search = result['search']
+            
+            page_info = search['pageInfo']
+            return search['nodes'], page_info['hasNextPage'], page_info['endCursor']
         
-        logger.info(f"Fetched reviews from {len(reviews_by_pr)} PRs for {github_username}")
-        return list(reviews_by_pr.values())
+        # Paginate through all matching PRs, skipping any repeated across pages
+        async for nodes in self._iter_pages(query_page, max_pages=10, on_truncated=on_truncated):
+            for pr in nodes:
+                if pr['url'] in seen_urls:
+                    continue
+                seen_urls.add(pr['url'])
+                
+                # Skip PRs updated after the window, PRs this user authored, and PRs
+                # with no submitted reviews
+                if updated_until and pr['updatedAt'][:10] > updated_until:
+                    continue
+                if pr['author']['login'] == github_username or not pr['reviews']['totalCount']:
+                    continue
+                
+                author_reviews = await self._fetch_author_reviews(pr, github_username, cache_ttl, include_bodies)
+                if author_reviews:
+                    yield pr, author_reviews
     
-    def _process_pr_reviews(self, pr: Dict, github_username: str, search_query: str, 
-                         cursor: Optional[str], reviews_by_pr: Dict[str, PRWithReviews]) -> None:
-        """Process reviews for a single PR.
+    async def _fetch_author_reviews(self, pr: Dict, github_username: str,
+                                    cache_ttl: Optional[float] = None,
+                                    include_bodies: bool = True) -> List[Dict]:
+        """Collect a user's review nodes on a PR across every page of reviews.
         
         Args:
             pr: PR data from GitHub API
             github_username: GitHub username to filter reviews by
-            search_query: Original search query
-            cursor: Current pagination cursor
-            reviews_by_pr: Dictionary to store processed reviews
-        """
-        # Skip if this user authored the PR
-        if pr['author']['login'] == github_username:
-            return
+            cache_ttl: Cache TTL in seconds for follow-up review pages
+            include_bodies: Whether follow-up pages fetch review and comment bodies
             
+        Returns:
+            List[Dict]: The user's review nodes
+        """
+        def by_author(review: Dict) -> bool:
+            return review['author'] is not None and review['author']['login'] == github_username
+        
+        # Get reviews by this author from the first page; most PRs have no more
+        reviews = pr['reviews']
+        author_reviews = list(filter(by_author, reviews['nodes']))
+        
         # Handle pagination for reviews within each PR
-        reviews_cursor = None
-        has_more_reviews = True
-        
-        while has_more_reviews:
-            if reviews_cursor:
-                # Fetch next page of reviews for this PR
-                variables = {
-                    "searchQuery": search_query,
-                    "after": cursor,
-                    "reviewsAfter": reviews_cursor
-                }
-                result = self.github_client.execute_query(self.reviews_query, variables)
-                pr = result['search']['nodes'][0]  # We're querying the same PR
-            
-            # Get reviews by this author from current page
-            author_reviews = [
-                review for review in pr['reviews']['nodes']
-                if review['author'] and review['author']['login'] == github_username
-            ]
-            
-            if author_reviews:  # Only process if they reviewed someone else's PR
-                pr_url = pr['url']
-                if pr_url not in reviews_by_pr:
-                    reviews_by_pr[pr_url] = PRWithReviews(
-                        title=pr['title'],
-                        url=pr_url
-                    )
-                
-                # Process each review
-                for review in author_reviews:
-                    self._add_review_to_pr(review, github_username, reviews_by_pr[pr_url])
+        while reviews['pageInfo']['hasNextPage']:
+            # Fetch next page of reviews for just this PR
+            variables = {"id": pr['id'], "reviewsAfter": reviews['pageInfo']['endCursor']}
+            page_query = _PR_REVIEWS_PAGE_FULL_DOC if include_bodies else _PR_REVIEWS_PAGE_COUNTS_DOC
+            result = await self.github_client.execute_query(page_query, variables, cache_ttl)
+            reviews = result['node']['reviews']
+            author_reviews.extend(filter(by_author, reviews['nodes']))
+        
+        return author_reviews
+    
+    def _build_pr_with_reviews(self, pr: Dict, author_reviews: List[Dict],
+                               github_username: str) -> PRWithReviews:
+        """Convert a PR and the user's review nodes on it to our model.
+        
+        Args:
+            pr: PR data with at least ``title`` and ``url``
+            author_reviews: The user's review nodes on the PR
+            github_username: GitHub username of reviewer
             
-            # Check if we need to fetch more reviews
-            reviews_page_info = pr['reviews']['pageInfo']
-            has_more_reviews = reviews_page_info['hasNextPage']
-            reviews_cursor = reviews_page_info['endCursor']
+        Returns:
+            PRWithReviews: The PR with the user's reviews
+        """
+        pr_with_reviews = PRWithReviews(
+            title=pr['title'],
+            url=pr['url']
+        )
+        for review in author_reviews:
+            self._add_review_to_pr(review, github_username, pr_with_reviews)
+        return pr_with_reviews
     
     def _add_review_to_pr(self, review: Dict, github_username: str, pr_with_reviews: PRWithReviews) -> None:
         """Process a single review and add it to a PRWithReviews object.
@@ -606,25 +1798,18 @@ class GitHubDataFetcher:
             github_username: GitHub username of reviewer
             pr_with_reviews: PRWithReviews object to add review to
         """
-        # Convert comments to our model
-        comments = []
-        for comment in review['comments']['nodes']:
-            try:
-                created_at = datetime.fromisoformat(comment['createdAt'].replace('Z', '+00:00'))
-                comments.append(Comment(
-                    body=comment['body'],
-                    created_at=created_at
-                ))
-            except (ValueError, KeyError) as e:
-                logger.warning(f"Error processing comment: {str(e)}")
-        
-        # Create review object
         try:
-            created_at = datetime.fromisoformat(review['createdAt'].replace('Z', '+00:00'))
+            # Convert comments to our model, stripping bodies once here rather than on every use
+            comments = [
+                Comment(body=comment['body'].strip(), created_at=parse_timestamp(comment['createdAt']))
+                for comment in review['comments'].get('nodes', ())
+            ]
+            
+            # Create review object
             review_obj = Review(
                 state=review['state'],
-                created_at=created_at,
-                body=review['body'],
+                created_at=parse_timestamp(review['createdAt']),
+                body=review.get('body', '').strip(),
                 comment_count=review['comments']['totalCount'],
                 author=github_username,
                 comments=comments
@@ -657,27 +1842,25 @@ class ActivityAnalyzer:
         logger.info(f"Generating summary for {member['name']} ({member['github']})")
         
         try:
-            # Calculate PR statistics - handle missing fields gracefully
-            total_additions = sum(pr.get('additions', 0) for pr in prs)
-            total_deletions = sum(pr.get('deletions', 0) for pr in prs)
-            total_files = sum(pr.get('changedFiles', 0) for pr in prs)
-            
-            # Find top PRs by discussion volume (comments + reviews)
-            top_prs = sorted(
-                prs,
-                key=lambda p: (
-                    p.get('comments', {}).get('totalCount', 0) + 
-                    p.get('reviews', {}).get('totalCount', 0)
-                ),
-                reverse=True
-            )[:10]
+            # Calculate PR statistics in one pass - handle missing fields gracefully
+            total_additions = total_deletions = total_files = 0
+            scored_prs = []
+            for pr in prs:
+                total_additions += pr.get('additions', 0)
+                total_deletions += pr.get('deletions', 0)
+                total_files += pr.get('changedFiles', 0)
+                # Discussion volume (comments + reviews), computed once per PR
+                discussion = (
+                    pr.get('comments', {}).get('totalCount', 0) + 
+                    pr.get('reviews', {}).get('totalCount', 0)
+                )
+                scored_prs.append((discussion, pr))
+            
+            # Find top PRs by discussion volume
+            top_prs = [pr for _, pr in heapq.nlargest(10, scored_prs, key=itemgetter(0))]
             
             # Find most engaged reviews by comment count
-            most_engaged = sorted(
-                reviews,
-                key=lambda r: r.total_comments,
-                reverse=True
-            )[:10]
+            most_engaged = heapq.nlargest(10, reviews, key=lambda r: r.total_comments)
             
             # Create summary
             summary = TeamMemberSummary(
@@ -724,184 +1907,226 @@ class ReportFormatter:
         return dt.strftime('%Y-%m-%d %H:%M:%S')
     
     @staticmethod
-    def print_member_summary(summary: TeamMemberSummary) -> None:
+    def print_member_summary(summary: TeamMemberSummary, detailed: bool = True) -> None:
         """Print a formatted summary for a team member.
         
+        The report is assembled in memory and written to stdout at once.
+        
         Args:
             summary: Team member summary to print
+            detailed: Include the review and comment text of every reviewed PR
         """
         logger.info(f"Displaying summary for {summary.name}")
         
-        print(f"\n=== Summary for {summary.name} ({summary.github_username}) ===")
-        print(f"\nPR Activity:")
-        print(f"- Authored {summary.authored_prs} PRs")
-        print(f"- Changed {summary.total_files_changed} files (+{summary.total_additions}/-{summary.total_deletions})")
-        print(f"- Gave {summary.reviews_given} reviews with {summary.total_review_comments} comments")
+        lines = []
+        lines.append(f"\n=== Summary for {summary.name} ({summary.github_username}) ===")
+        lines.append(f"\nPR Activity:")
+        lines.append(f"- Authored {summary.authored_prs} PRs")
+        lines.append(f"- Changed {summary.total_files_changed} files (+{summary.total_additions}/-{summary.total_deletions})")
+        lines.append(f"- Gave {summary.reviews_given} reviews with {summary.total_review_comments} comments")
         
-        ReportFormatter._print_top_prs(summary.top_prs)
-        ReportFormatter._print_engaged_reviews(summary.most_engaged_reviews)
-        ReportFormatter._print_all_prs(summary.all_prs)
-        ReportFormatter._print_all_reviews(summary.all_reviewed_prs)
+        ReportFormatter._format_top_prs(summary.top_prs, lines)
+        ReportFormatter._format_engaged_reviews(summary.most_engaged_reviews, lines, detailed)
+        ReportFormatter._format_all_prs(summary.all_prs, lines)
+        if detailed:
+            ReportFormatter._format_all_reviews(summary.all_reviewed_prs, lines)
+        
+        sys.stdout.write("\n".join(lines) + "\n")
     
     @staticmethod
-    def _print_top_prs(prs: List[GitHubPR]) -> None:
-        """Print top PRs by discussion volume.
+    def _format_top_prs(prs: List[GitHubPR], lines: List[str]) -> None:
+        """Format top PRs by discussion volume.
         
         Args:
-            prs: List of PRs to print
+            prs: List of PRs to format
+            lines: Output lines to append to
         """
-        print("\nTop 10 Most Discussed PRs Authored:")
+        lines.append("\nTop 10 Most Discussed PRs Authored:")
         if not prs:
-            print("  None found")
+            lines.append("  None found")
             return
             
         for pr in prs:
-            print(f"• {pr.get('title', 'No title')}")
-            print(f"  {pr.get('url', 'No URL')}")
+            lines.append(f"• {pr.get('title', 'No title')}")
+            lines.append(f"  {pr.get('url', 'No URL')}")
             comments_count = pr.get('comments', {}).get('totalCount', 0)
             reviews_count = pr.get('reviews', {}).get('totalCount', 0)
-            print(f"  {comments_count} comments, {reviews_count} reviews")
+            lines.append(f"  {comments_count} comments, {reviews_count} reviews")
     
     @staticmethod
-    def _print_engaged_reviews(reviews: List[PRWithReviews]) -> None:
-        """Print most engaged reviews.
+    def _format_engaged_reviews(reviews: List[PRWithReviews], lines: List[str], detailed: bool = True) -> None:
+        """Format most engaged reviews.
         
         Args:
-            reviews: List of reviews to print
+            reviews: List of reviews to format
+            lines: Output lines to append to
+            detailed: Include each review's date, state and text; without it
+                review bodies were not fetched, so only counts are shown
         """
-        print("\nTop 10 Most Engaged Reviews:")
+        lines.append("\nTop 10 Most Engaged Reviews:")
         if not reviews:
-            print("  None found")
+            lines.append("  None found")
             return
             
         for pr in reviews:
-            print(f"• {pr.title}")
-            print(f"  {pr.url}")
-            print(f"  {pr.total_comments} comments across {len(pr.reviews)} reviews")
+            lines.append(f"• {pr.title}")
+            lines.append(f"  {pr.url}")
+            lines.append(f"  {pr.total_comments} comments across {len(pr.reviews)} reviews")
+            if not detailed:
+                continue
             
-            # Print detailed review information
+            # Format detailed review information
             for review in pr.reviews:
-                print(f"    Review on {ReportFormatter.format_date(review.created_at)} - {review.state}")
-                if review.body.strip():
-                    print(f"    Review comment: {review.body.strip()}")
+                lines.append(f"    Review on {ReportFormatter.format_date(review.created_at)} - {review.state}")
+                if review.body:
+                    lines.append(f"    Review comment: {review.body}")
                 if review.comments:
-                    print("    Detailed comments:")
+                    lines.append("    Detailed comments:")
                     for comment in review.comments:
-                        print(f"      [{ReportFormatter.format_date(comment.created_at)}]")
-                        print(f"      {comment.body.strip()}")
-                    print()
+                        lines.append(f"      [{ReportFormatter.format_date(comment.created_at)}]")
+                        lines.append(f"      {comment.body}")
+                    lines.append("")
     
     @staticmethod
-    def _print_all_prs(prs: List[GitHubPR]) -> None:
-        """Print all authored PRs.
+    def _format_all_prs(prs: List[GitHubPR], lines: List[str]) -> None:
+        """Format all authored PRs.
         
         Args:
-            prs: List of PRs to print
+            prs: List of PRs to format
+            lines: Output lines to append to
         """
-        print("\nAll Authored PRs:")
+        lines.append("\nAll Authored PRs:")
         if not prs:
-            print("  None found")
+            lines.append("  None found")
             return
             
         for pr in prs:
-            print(f"• {pr.get('title', 'No title')}")
-            print(f"  {pr.get('url', 'No URL')}")
+            lines.append(f"• {pr.get('title', 'No title')}")
+            lines.append(f"  {pr.get('url', 'No URL')}")
     
     @staticmethod
-    def _print_all_reviews(reviews: List[PRWithReviews]) -> None:
-        """Print all reviewed PRs with comments.
+    def _format_all_reviews(reviews: List[PRWithReviews], lines: List[str]) -> None:
+        """Format all reviewed PRs with comments.
         
         Args:
-            reviews: List of reviews to print
+            reviews: List of reviews to format
+            lines: Output lines to append to
         """
-        print("\nAll Reviewed PRs with Comments:")
+        lines.append("\nAll Reviewed PRs with Comments:")
         if not reviews:
-            print("  None found")
+            lines.append("  None found")
             return
             
         has_comments = False
         for pr in reviews:
-            if any(review.comments or review.body.strip() for review in pr.reviews):
+            if any(review.comments or review.body for review in pr.reviews):
                 has_comments = True
-                print(f"\n• {pr.title}")
-                print(f"  {pr.url}")
+                lines.append(f"\n• {pr.title}")
+                lines.append(f"  {pr.url}")
                 for review in pr.reviews:
-                    if review.body.strip() or review.comments:
-                        print(f"  Review on {ReportFormatter.format_date(review.created_at)} - {review.state}")
-                        if review.body.strip():
-                            print(f"    {review.body.strip()}")
+                    if review.body or review.comments:
+                        lines.append(f"  Review on {ReportFormatter.format_date(review.created_at)} - {review.state}")
+                        if review.body:
+                            lines.append(f"    {review.body}")
                         for comment in review.comments:
-                            print(f"    [{ReportFormatter.format_date(comment.created_at)}]")
-                            print(f"    {comment.body.strip()}")
+                            lines.append(f"    [{ReportFormatter.format_date(comment.created_at)}]")
+                            lines.append(f"    {comment.body}")
         
         if not has_comments:
-            print("  None found")
+            lines.append("  None found")
 
 class DataExporter:
     """Class for exporting GitHub data to various formats."""
     
     @staticmethod
-    def export_reviews_to_csv(reviews: List[PRWithReviews], output_file: str) -> None:
+    def _q(value: str) -> str:
+        """Quote a CSV field the way csv.writer's default QUOTE_MINIMAL does.
+        
+        Args:
+            value: Field text
+            
+        Returns:
+            str: The field, quoted only if it contains a delimiter, quote or line break
+        """
+        if ',' in value or '"' in value or '\n' in value or '\r' in value:
+            return '"' + value.replace('"', '""') + '"'
+        return value
+    
+    @staticmethod
+    def _iter_rows(pr: PRWithReviews) -> Iterator[str]:
+        """Generate the formatted CSV lines for one PR's reviews.
+        
+        The column layout is fixed, so lines are built directly rather than
+        through csv.writer; dates and states never need quoting.
+        
+        Args:
+            pr: PR with review data
+            
+        Yields:
+            str: One CRLF-terminated line per review body and per review comment
+        """
+        q = DataExporter._q
+        prefix = f"{q(pr.url)},{q(pr.title)},"
+        for review in pr.reviews:
+            review_prefix = f"{prefix}{review.created_at.isoformat()},{review.state},"
+            
+            # The review-level comment if it exists, with no specific comment date or body
+            if review.body:
+                yield f"{review_prefix}{q(review.body)},,\r\n"
+            
+            # Individual comments, with no review body
+            for comment in review.comments:
+                yield f"{review_prefix},{comment.created_at.isoformat()},{q(comment.body)}\r\n"
+    
+    @staticmethod
+    async def export_reviews_to_csv(reviews: AsyncIterator[PRWithReviews], output_file: str) -> None:
         """Export review comments to CSV format.
         
+        Rows are written as PRs arrive from the iterator, so only one PR's
+        reviews are held in memory at a time. If the iterator is empty the
+        output file is not created.
+        
         Args:
-            reviews: List of PRs with review data
+            reviews: Async iterator of PRs with review data
             output_file: Path to output CSV file
             
         Raises:
             IOError: If file cannot be written
         """
-        logger.info(f"Exporting {sum(len(pr.reviews) for pr in reviews)} reviews to {output_file}")
+        # Peek at the first PR so an empty result never touches the disk
+        pr = await anext(reviews, None)
+        if pr is None:
+            logger.info("No reviews to export")
+            return
+        
+        logger.info(f"Exporting reviews to {output_file}")
         
         try:
             # Create directory if it doesn't exist
             output_path = Path(output_file)
             output_path.parent.mkdir(parents=True, exist_ok=True)
             
-            with open(output_file, 'w', newline='', encoding='utf-8') as f:
-                writer = csv.writer(f)
+            # A 1 MiB buffer batches many rows into each write(2)
+            with open(output_file, 'w', newline='', encoding='utf-8', buffering=1 << 20) as f:
                 # Write header
-                writer.writerow([
-                    'pr_url',
-                    'pr_title', 
-                    'review_date',
-                    'review_state',
-                    'review_body',
-                    'comment_date',
-                    'comment_body'
-                ])
+                csv.writer(f).writerow(_CSV_HEADER)
                 
-                # Write data
+                # Write data, bypassing the csv module
                 rows_written = 0
-                for pr in reviews:
-                    for review in pr.reviews:
-                        # Write the review-level comment if it exists
-                        if review.body.strip():
-                            writer.writerow([
-                                pr.url,
-                                pr.title,
-                                review.created_at.isoformat(),
-                                review.state,
-                                review.body.strip(),
-                                '',  # No specific comment date
-                                ''   # No specific comment body
-                            ])
-                            rows_written += 1
-                        
-                        # Write individual comments
-                        for comment in review.comments:
-                            writer.writerow([
-                                pr.url,
-                                pr.title,
-                                review.created_at.isoformat(),
-                                review.state,
-                                '',  # No review body
-                                comment.created_at.isoformat(),
-                                comment.body.strip()
-                            ])
-                            rows_written += 1
+                reviews_written = 0
+                batch = []
+                while pr is not None:
+                    reviews_written += len(pr.reviews)
+                    batch.extend(DataExporter._iter_rows(pr))
+                    if len(batch) >= CSV_ROWS_PER_WRITE:
+                        f.write(''.join(batch))
+                        rows_written += len(batch)
+                        batch.clear()
+                    pr = await anext(reviews, None)
+                f.write(''.join(batch))
+                rows_written += len(batch)
                 
-                logger.info(f"Exported {rows_written} rows to {output_file}")
+                logger.info(f"Exported {rows_written} rows from {reviews_written} reviews to {output_file}")
                 
         except IOError as e:
             logger.error(f"Error writing to {output_file}: {str(e)}")
@@ -941,11 +2166,101 @@ class CLIParser:
             help='Path to team members YAML file',
             metavar='FILE'
         )
+        parser.add_argument(
+            '--refresh',
+            action='store_true',
+            help='Ignore cached API responses and fetch fresh data'
+        )
+        parser.add_argument(
+            '--no-cache',
+            action='store_true',
+            help='Neither read nor write the API response cache'
+        )
+        parser.add_argument(
+            '--full-refresh',
+            action='store_true',
+            help='Ignore saved watermarks and cached responses, and re-fetch the whole date range'
+        )
         parser.add_argument(
             '--verbose', '-v',
             action='store_true',
             help='Enable verbose logging'
         )
+    
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def build_parser() -> argparse.ArgumentParser:
+        """Build the command line parser.
+        
+        The parser is built once and reused by later calls.
+        
+        Returns:
+            argparse.ArgumentParser: Parser with the summary and reviews subcommands
+        """
+        parser = argparse.ArgumentParser(
+            description='Fetch and analyze GitHub contributions for team members',
+            formatter_class=argparse.RawDescriptionHelpFormatter,
+            epilog="""
+Examples:
+  # Get summary for all team members
+  %(prog)s summary
+  
+  # Get summary for specific user
+  %(prog)s summary --user johndoe
+  
+  # Include the text of every review and comment
+  %(prog)s summary --detailed
+  
+  # Export code review comments to CSV
+  %(prog)s reviews --user johndoe --output reviews.csv
+  
+  # Specify custom repository and date range
+  %(prog)s summary --repo owner/repo --start-date 2023-01-01 --end-date 2023-12-31
+  
+  # Enable verbose logging
+  %(prog)s summary -v
+            """
+        )
+        subparsers = parser.add_subparsers(dest='command', help='Command to run', required=True)
+        
+        # Summary command
+        summary_parser = subparsers.add_parser('summary', 
+            help='Generate activity summary',
+            description='Generate a detailed summary of GitHub activity including PRs authored and reviews given.'
+        )
+        summary_parser.add_argument(
+            '--user', 
+            help='GitHub username to analyze (if omitted, analyzes all team members)',
+            metavar='USERNAME'
+        )
+        summary_parser.add_argument(
+            '--detailed',
+            action='store_true',
+            help='Fetch and print the text of every review and comment (slower)'
+        )
+        CLIParser.add_common_arguments(summary_parser)
+        
+        # Reviews command
+        reviews_parser = subparsers.add_parser('reviews',
+            help='Export review comments to CSV',
+            description='''Export code review comments to CSV format for analysis.
+    The CSV will include PR URLs, review states, comment text, and timestamps.'''
+        )
+        reviews_parser.add_argument(
+            '--user',
+            required=True,
+            help='GitHub username whose reviews to analyze',
+            metavar='USERNAME'
+        )
+        reviews_parser.add_argument(
+            '--output',
+            required=True,
+            help='Path for output CSV file',
+            metavar='FILE'
+        )
+        CLIParser.add_common_arguments(reviews_parser)
+        
+        return parser
 
 class CodeReviewAnalyzer:
     """Main application class for code review analysis."""
@@ -954,6 +2269,7 @@ class CodeReviewAnalyzer:
         """Initialize the analyzer."""
         self.github_client = None
         self.data_fetcher = None
+        self.state = None
     
     def configure_logging(self, verbose: bool = False) -> None:
         """Configure logging level based on verbosity.
@@ -967,19 +2283,29 @@ class CodeReviewAnalyzer:
         else:
             logger.setLevel(logging.INFO)
     
-    def setup_github_client(self) -> None:
+    async def setup_github_client(self, refresh: bool = False, full_refresh: bool = False,
+                                  no_cache: bool = False) -> None:
         """Set up the GitHub client.
         
+        Args:
+            refresh: Ignore cached API responses and fetch fresh data
+            full_refresh: Ignore saved watermarks and cached responses and re-fetch
+                the whole date range
+            no_cache: Don't use the API response cache at all
+            
         Raises:
             GitHubAPIError: If GitHub client setup fails
         """
         logger.info("Initializing GitHub client...")
-        self.github_client = GitHubClient(GITHUB_TOKEN)
-        self.github_client.validate_and_connect()
-        self.data_fetcher = GitHubDataFetcher(self.github_client)
+        # A full refresh must not be answered from responses cached by earlier full runs
+        cache = None if no_cache else ResponseCache(CACHE_PATH, refresh=refresh or full_refresh, scope=GITHUB_TOKEN)
+        self.github_client = GitHubClient(GITHUB_TOKEN, cache=cache)
+        await self.github_client.validate_and_connect()
+        self.state = LookbackState(STATE_PATH, full_refresh=full_refresh)
+        self.data_fetcher = GitHubDataFetcher(self.github_client, self.state)
         logger.info("GitHub client initialized successfully")
     
-    def validate_repository(self, repo_string: str) -> tuple:
+    async def validate_repository(self, repo_string: str) -> tuple:
         """Validate and parse repository string.
         
         Args:
@@ -991,15 +2317,14 @@ class CodeReviewAnalyzer:
         Raises:
             ValueError: If repository format is invalid
         """
-        repo_parts = repo_string.split('/')
-        if len(repo_parts) != 2:
+        owner, sep, repo = repo_string.partition('/')
+        if not sep or not owner or not repo or '/' in repo:
             raise ValueError(f"Invalid repository format. Expected 'owner/repo', got '{repo_string}'")
         
-        owner, repo = repo_parts
-        self.github_client.verify_repository(owner, repo)
+        await self.github_client.verify_repository(owner, repo)
         return owner, repo
     
-    def process_reviews_command(self, args) -> None:
+    async def process_reviews_command(self, args) -> None:
         """Process the reviews command.
         
         Args:
@@ -1008,30 +2333,27 @@ class CodeReviewAnalyzer:
         Raises:
             ValueError: If user not found or processing fails
         """
-        # Load team members
-        team_members = TeamLoader.load_team_members(args.team_file)
-        
         # Validate user exists in team
         try:
-            member = TeamLoader.get_team_member(team_members, args.user)
+            member = TeamLoader.get_single_member(args.team_file, args.user)
             logger.info(f"Processing reviews for {member['name']} ({args.user})")
         except ValueError as e:
             logger.error(str(e))
             raise
         
-        # Fetch and export reviews
+        # Stream reviews straight into the CSV as they are fetched
         logger.info(f"Fetching reviews for {args.user}...")
-        reviews = self.data_fetcher.fetch_user_reviews(
+        reviews = self.data_fetcher.iter_user_reviews(
             args.user, 
             repository=args.repo,
             start_date=args.start_date, 
             end_date=args.end_date
         )
         
-        DataExporter.export_reviews_to_csv(reviews, args.output)
+        await DataExporter.export_reviews_to_csv(reviews, args.output)
         logger.info("Export complete!")
     
-    def process_summary_command(self, args) -> None:
+    async def process_summary_command(self, args) -> None:
         """Process the summary command.
         
         Args:
@@ -1040,51 +2362,75 @@ class CodeReviewAnalyzer:
         Raises:
             ValueError: If user not found or processing fails
         """
-        # Load team members
-        team_members = TeamLoader.load_team_members(args.team_file)
-        
-        # Filter to single user if specified
+        # Load team members, or just the one requested
         if args.user:
             try:
-                member = TeamLoader.get_team_member(team_members, args.user)
-                team_members = [member]
+                team_members = [TeamLoader.get_single_member(args.team_file, args.user)]
             except ValueError as e:
                 logger.error(str(e))
                 raise
+        else:
+            team_members = TeamLoader.load_team_members(args.team_file)
         
-        # Process each team member
+        # Fetch everyone's PRs and reviews together
+        prs_by_user, reviews_by_user = await self.data_fetcher.fetch_team_activity(
+            [member['github'] for member in team_members],
+            repository=args.repo,
+            start_date=args.start_date,
+            end_date=args.end_date,
+            include_bodies=args.detailed
+        )
+        
+        # Generate and display summaries in team order
         summaries = []
         for member in team_members:
-            github_username = member['github']
-            logger.info(f"Processing data for {member['name']} ({github_username})")
-            
-            # Fetch data
-            prs = self.data_fetcher.fetch_user_prs(
-                github_username, 
-                repository=args.repo,
-                start_date=args.start_date, 
-                end_date=args.end_date
-            )
-            
-            reviews = self.data_fetcher.fetch_user_reviews(
-                github_username, 
-                repository=args.repo,
-                start_date=args.start_date, 
-                end_date=args.end_date
+            summary = ActivityAnalyzer.generate_member_summary(
+                member, prs_by_user[member['github']], reviews_by_user[member['github']]
             )
-            
-            # Generate and display summary
-            summary = ActivityAnalyzer.generate_member_summary(member, prs, reviews)
             summaries.append(summary)
-            ReportFormatter.print_member_summary(summary)
+            ReportFormatter.print_member_summary(summary, detailed=args.detailed)
         
         # Print team-wide statistics
         if summaries:
             logger.info("Generating team-wide statistics")
-            print("\n=== Team-wide Statistics ===")
-            print(f"Total PRs: {sum(s.authored_prs for s in summaries)}")
-            print(f"Total Reviews: {sum(s.reviews_given for s in summaries)}")
-            print(f"Total Files Changed: {sum(s.total_files_changed for s in summaries)}")
+            total_prs = total_reviews = total_files = 0
+            for s in summaries:
+                total_prs += s.authored_prs
+                total_reviews += s.reviews_given
+                total_files += s.total_files_changed
+            sys.stdout.write(
+                "\n=== Team-wide Statistics ===\n"
+                f"Total PRs: {total_prs}\n"
+                f"Total Reviews: {total_reviews}\n"
+                f"Total Files Changed: {total_files}\n"
+            )
+    
+    async def run_command(self, args) -> None:
+        """Connect to GitHub and run the selected command.
+        
+        Args:
+            args: Command line arguments
+        """
+        try:
+            # Set up GitHub client
+            await self.setup_github_client(
+                refresh=args.refresh, full_refresh=args.full_refresh, no_cache=args.no_cache
+            )
+            
+            # Validate repository format
+            await self.validate_repository(args.repo)
+            
+            # Process command
+            if args.command == 'reviews':
+                await self.process_reviews_command(args)
+            elif args.command == 'summary':
+                await self.process_summary_command(args)
+            
+            # Only record watermarks once the whole command has succeeded
+            self.state.save()
+        finally:
+            if self.github_client:
+                await self.github_client.close()
     
     def main(self) -> int:
         """Main entry point.
@@ -1093,60 +2439,7 @@ class CodeReviewAnalyzer:
             int: Exit code (0 for success, non-zero for error)
         """
         # Set up argument parser
-        parser = argparse.ArgumentParser(
-            description='Fetch and analyze GitHub contributions for team members',
-            formatter_class=argparse.RawDescriptionHelpFormatter,
-            epilog="""
-Examples:
-  # Get summary for all team members
-  %(prog)s summary
-  
-  # Get summary for specific user
-  %(prog)s summary --user johndoe
-  
-  # Export code review comments to CSV
-  %(prog)s reviews --user johndoe --output reviews.csv
-  
-  # Specify custom repository and date range
-  %(prog)s summary --repo owner/repo --start-date 2023-01-01 --end-date 2023-12-31
-  
-  # Enable verbose logging
-  %(prog)s summary -v
-            """
-        )
-        subparsers = parser.add_subparsers(dest='command', help='Command to run', required=True)
-        
-        # Summary command
-        summary_parser = subparsers.add_parser('summary', 
-            help='Generate activity summary',
-            description='Generate a detailed summary of GitHub activity including PRs authored and reviews given.'
-        )
-        summary_parser.add_argument(
-            '--user', 
-            help='GitHub username to analyze (if omitted, analyzes all team members)',
-            metavar='USERNAME'
-        )
-        CLIParser.add_common_arguments(summary_parser)
-        
-        # Reviews command
-        reviews_parser = subparsers.add_parser('reviews',
-            help='Export review comments to CSV',
-            description='''Export code review comments to CSV format for analysis.
-    The CSV will include PR URLs, review states, comment text, and timestamps.'''
-        )
-        reviews_parser.add_argument(
-            '--user',
-            required=True,
-            help='GitHub username whose reviews to analyze',
-            metavar='USERNAME'
-        )
-        reviews_parser.add_argument(
-            '--output',
-            required=True,
-            help='Path for output CSV file',
-            metavar='FILE'
-        )
-        CLIParser.add_common_arguments(reviews_parser)
+        parser = CLIParser.build_parser()
         
         # Parse arguments
         args = parser.parse_args()
@@ -1155,18 +2448,7 @@ Examples:
         self.configure_logging(args.verbose)
         
         try:
-            # Set up GitHub client
-            self.setup_github_client()
-            
-            # Validate repository format
-            self.validate_repository(args.repo)
-            
-            # Process command
-            if args.command == 'reviews':
-                self.process_reviews_command(args)
-            elif args.command == 'summary':
-                self.process_summary_command(args)
-            
+            asyncio.run(self.run_command(args))
             return 0
         
         except TokenValidationError as e:
@@ -0,0 +1,72 @@
+"""Tests for merging several queries into one aliased GraphQL request."""
+import asyncio
+import os
+import unittest
+
+from graphql import print_ast
+
+os.environ.setdefault("GITHUB_API_TOKEN", "test-token")
+
+import fetch
+
+class FakeSession:
+    """Answers each aliased search with the search string it was given."""
+
+    def __init__(self):
+        self.requests = []
+
+    async def execute(self, document, variable_values=None):
+        self.requests.append((document, variable_values))
+        return {
+            f"b{name.rpartition('_')[2]}_search": {'query': value}
+            for name, value in variable_values.items()
+            if name.startswith('searchQuery_')
+        }
+
+class BuildBatchDocumentTest(unittest.TestCase):
+    """Queries are renamed apart and share their fragments."""
+
+    def test_variables_and_aliases_are_suffixed(self):
+        document = fetch.GitHubClient._build_batch_document([fetch._PR_QUERY_DOC, fetch._REVIEWS_QUERY_COUNTS_DOC])
+        text = print_ast(document)
+
+        self.assertIn('$searchQuery_0: String!', text)
+        self.assertIn('$after_1: String', text)
+        self.assertIn('b0_search: search(', text)
+        self.assertIn('b1_search: search(', text)
+        self.assertIn('query: $searchQuery_1', text)
+        self.assertNotIn('$searchQuery:', text)
+
+    def test_shared_fragments_appear_once(self):
+        document = fetch.GitHubClient._build_batch_document([fetch._PR_QUERY_DOC] * 3)
+
+        self.assertEqual(print_ast(document).count('fragment PRFields'), 1)
+        self.assertIsNotNone(document.loc)
+
+class ExecuteBatchTest(unittest.TestCase):
+    """Batched responses are split back into one result per query."""
+
+    def test_results_in_query_order(self):
+        client = fetch.GitHubClient('test-token')
+        client.session = FakeSession()
+        queries = [(fetch._PR_QUERY_DOC, {'searchQuery': f'q{i}'}) for i in range(5)]
+
+        results = asyncio.run(client.execute_batch(queries, max_batch_size=2))
+
+        self.assertEqual(results, [{'search': {'query': f'q{i}'}} for i in range(5)])
+        self.assertEqual(len(client.session.requests), 3)
+        self.assertEqual(client.session.requests[0][1], {'searchQuery_0': 'q0', 'searchQuery_1': 'q1'})
+
+    def test_built_documents_are_reused(self):
+        client = fetch.GitHubClient('test-token')
+        client.session = FakeSession()
+        queries = [(fetch._PR_QUERY_DOC, {'searchQuery': 'a'}), (fetch._PR_QUERY_DOC, {'searchQuery': 'b'})]
+
+        asyncio.run(client.execute_batch(queries))
+        asyncio.run(client.execute_batch(queries))
+
+        first, second = (document for document, _ in client.session.requests)
+        self.assertIs(first, second)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,112 @@
+"""Tests for how GitHubClient classifies and retries failed requests."""
+import asyncio
+import os
+import unittest
+
+import httpx
+
+os.environ.setdefault("GITHUB_API_TOKEN", "test-token")
+
+import fetch
+
+def make_client(handler) -> fetch.GitHubClient:
+    """Build a client whose HTTP requests are answered by ``handler``."""
+    client = fetch.GitHubClient('test-token')
+    client.client.transport.kwargs['transport'] = httpx.MockTransport(handler)
+    return client
+
+async def run_query(client: fetch.GitHubClient):
+    """Connect, run one query and close the client."""
+    await client.connect()
+    try:
+        return await client.execute_query(fetch._VIEWER_QUERY_DOC)
+    finally:
+        await client.close()
+
+class TimeoutTest(unittest.TestCase):
+    """Slow requests are bounded by httpx and retried."""
+
+    def test_gql_execute_timeout_disabled(self):
+        self.assertIsNone(fetch.GitHubClient('test-token').client.execute_timeout)
+
+    def test_timeout_is_retried(self):
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            if len(calls) == 1:
+                raise httpx.ReadTimeout('', request=request)
+            return httpx.Response(200, json={'data': {'viewer': {'login': 'me'}}})
+
+        result = asyncio.run(run_query(make_client(handler)))
+
+        self.assertEqual(result, {'viewer': {'login': 'me'}})
+        self.assertEqual(len(calls), 2)
+
+class ForbiddenTest(unittest.TestCase):
+    """Only rate limit 403s are treated as throttling."""
+
+    def test_other_forbidden_fails_at_once(self):
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            return httpx.Response(403, json={'message': 'Resource protected by organization SAML enforcement.'})
+
+        client = make_client(handler)
+        with self.assertRaises(fetch.GitHubAPIError) as raised:
+            asyncio.run(run_query(client))
+
+        self.assertNotIsInstance(raised.exception, fetch.RateLimitError)
+        self.assertIn('SAML enforcement', str(raised.exception))
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(client.concurrency.limit, fetch.INITIAL_CONCURRENT_REQUESTS)
+
+    def test_rate_limit_is_retried(self):
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            if len(calls) == 1:
+                return httpx.Response(403, json={'message': 'You have exceeded a secondary rate limit.'},
+                                      headers={'retry-after': '0'})
+            return httpx.Response(200, json={'data': {'viewer': {'login': 'me'}}})
+
+        self.assertEqual(asyncio.run(run_query(make_client(handler))), {'viewer': {'login': 'me'}})
+        self.assertEqual(len(calls), 2)
+
+    def test_exhausted_retries_keep_last_error(self):
+        def handler(request):
+            return httpx.Response(403, json={'message': 'You have exceeded a secondary rate limit.'},
+                                  headers={'retry-after': '0'})
+
+        with self.assertRaises(fetch.GitHubAPIError) as raised:
+            asyncio.run(run_query(make_client(handler)))
+
+        self.assertIn('Failed after 5 retries', str(raised.exception))
+        self.assertIn('secondary rate limit', str(raised.exception))
+
+    def test_rate_limit_headers(self):
+        def response(**headers):
+            return httpx.Response(403, json={'message': 'Forbidden'}, headers=headers)
+
+        self.assertTrue(fetch.GitHubClient._is_rate_limited('403 Forbidden', response(**{'retry-after': '60'})))
+        self.assertTrue(fetch.GitHubClient._is_rate_limited(
+            '403 Forbidden', response(**{'x-ratelimit-remaining': '0'})
+        ))
+        self.assertFalse(fetch.GitHubClient._is_rate_limited(
+            '403 Forbidden', response(**{'x-ratelimit-remaining': '12'})
+        ))
+        self.assertFalse(fetch.GitHubClient._is_rate_limited('403 Forbidden', None))
+
+    def test_retry_after_read_from_failing_response(self):
+        client = fetch.GitHubClient('test-token')
+        # Headers left behind by another request that finished in the meantime
+        client.client.transport.response_headers = httpx.Headers({'retry-after': '5'})
+
+        self.assertEqual(client._retry_after(httpx.Response(429, headers={'retry-after': '60'})), 60.0)
+        self.assertIsNone(client._retry_after(httpx.Response(429)))
+        self.assertEqual(client._retry_after(), 5.0)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,120 @@
+"""Tests that the hand-formatted CSV export matches csv.writer."""
+import asyncio
+import csv
+import io
+import os
+import random
+import tempfile
+import unittest
+from datetime import datetime, timedelta, timezone
+
+os.environ.setdefault("GITHUB_API_TOKEN", "test-token")
+
+import fetch
+from fetch import Comment, DataExporter, PRWithReviews, Review
+
+# Characters that affect QUOTE_MINIMAL quoting, plus plain and non-ASCII text
+FUZZ_ALPHABET = [',', '"', '\r', '\n', ' ', 'a', 'Z', '0', "'", ';', '\t', 'é', '—', '😀']
+
+def reference_rows(pr: PRWithReviews) -> str:
+    """Format a PR's rows through csv.writer, as the export originally did."""
+    out = io.StringIO()
+    writer = csv.writer(out)
+    for review in pr.reviews:
+        if review.body:
+            writer.writerow([pr.url, pr.title, review.created_at.isoformat(), review.state, review.body, '', ''])
+        for comment in review.comments:
+            writer.writerow([
+                pr.url, pr.title, review.created_at.isoformat(), review.state, '',
+                comment.created_at.isoformat(), comment.body,
+            ])
+    return out.getvalue()
+
+def make_pr(title: str, bodies, comment_bodies) -> PRWithReviews:
+    """Build a PR with one review per body, each carrying the given comments."""
+    created = datetime(2024, 8, 3, 10, 0, tzinfo=timezone.utc)
+    reviews = [
+        Review(
+            state='COMMENTED',
+            created_at=created + timedelta(hours=i),
+            body=body,
+            comment_count=len(comment_bodies),
+            author='bob',
+            comments=[
+                Comment(body=comment_body, created_at=created + timedelta(hours=i, minutes=j))
+                for j, comment_body in enumerate(comment_bodies)
+            ],
+        )
+        for i, body in enumerate(bodies)
+    ]
+    return PRWithReviews(title=title, url='https://github.com/o/r/pull/1', reviews=reviews)
+
+class QuoteTest(unittest.TestCase):
+    """DataExporter._q quotes exactly like QUOTE_MINIMAL."""
+
+    def assertQuotedLikeCsv(self, value):
+        out = io.StringIO()
+        csv.writer(out).writerow([value, 'x'])
+        self.assertEqual(f"{DataExporter._q(value)},x\r\n", out.getvalue(), repr(value))
+
+    def test_special_characters(self):
+        for value in ['plain', 'a,b', 'say "hi"', 'line\nbreak', 'cr\rlf', '"', ',', '', ' padded ', 'naïve — ok']:
+            self.assertQuotedLikeCsv(value)
+
+    def test_fuzz(self):
+        rng = random.Random(2024)
+        for _ in range(2000):
+            self.assertQuotedLikeCsv(''.join(rng.choices(FUZZ_ALPHABET, k=rng.randint(0, 12))))
+
+class IterRowsTest(unittest.TestCase):
+    """DataExporter._iter_rows produces the same bytes as csv.writer."""
+
+    def assertRowsLikeCsv(self, pr):
+        self.assertEqual(''.join(DataExporter._iter_rows(pr)), reference_rows(pr))
+
+    def test_review_body_and_comments(self):
+        self.assertRowsLikeCsv(make_pr('Fix "parser", again', ['Looks good,\nbut see comments', ''],
+                                       ['nit', 'use "x"\r\nhere']))
+
+    def test_no_reviews(self):
+        self.assertRowsLikeCsv(make_pr('Empty', [], []))
+
+    def test_fuzz(self):
+        rng = random.Random(7)
+
+        def text():
+            return ''.join(rng.choices(FUZZ_ALPHABET, k=rng.randint(0, 10)))
+
+        for _ in range(500):
+            bodies = [text() for _ in range(rng.randint(0, 3))]
+            comment_bodies = [text() for _ in range(rng.randint(0, 3))]
+            self.assertRowsLikeCsv(make_pr(text(), bodies, comment_bodies))
+
+class ExportTest(unittest.TestCase):
+    """export_reviews_to_csv writes the header and rows csv.writer would."""
+
+    @staticmethod
+    async def iterate(prs):
+        for pr in prs:
+            yield pr
+
+    def test_export_matches_csv_writer(self):
+        prs = [make_pr('First, PR', ['body'], ['a "quoted" comment']), make_pr('Second', [''], ['x\ny'])]
+        expected = io.StringIO()
+        csv.writer(expected).writerow(fetch._CSV_HEADER)
+        expected.write(''.join(reference_rows(pr) for pr in prs))
+
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'out', 'reviews.csv')
+            asyncio.run(DataExporter.export_reviews_to_csv(self.iterate(prs), path))
+            with open(path, newline='', encoding='utf-8') as f:
+                self.assertEqual(f.read(), expected.getvalue())
+
+    def test_empty_export_creates_no_file(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'out', 'reviews.csv')
+            asyncio.run(DataExporter.export_reviews_to_csv(self.iterate([]), path))
+            self.assertFalse(os.path.exists(os.path.dirname(path)))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,139 @@
+"""Tests that trimmed GraphQL responses parse into the data models."""
+import os
+import unittest
+from datetime import datetime, timezone
+
+from graphql import FieldNode, FragmentDefinitionNode, parse
+
+os.environ.setdefault("GITHUB_API_TOKEN", "test-token")
+
+import fetch
+
+def fragment_shape(query: str, fragment: str) -> dict:
+    """Get the fields a named fragment selects, nested by sub-selection.
+
+    Args:
+        query: GraphQL document text
+        fragment: Fragment name
+
+    Returns:
+        dict: Field name mapped to its own shape, or None for scalars
+    """
+    def shape(selection_set):
+        return {
+            selection.name.value: shape(selection.selection_set) if selection.selection_set else None
+            for selection in selection_set.selections
+            if isinstance(selection, FieldNode)
+        }
+
+    for definition in parse(query).definitions:
+        if isinstance(definition, FragmentDefinitionNode) and definition.name.value == fragment:
+            return shape(definition.selection_set)
+    raise KeyError(fragment)
+
+def response_shape(value):
+    """Get the shape of a response value in the form used by ``fragment_shape``."""
+    if isinstance(value, dict):
+        return {key: response_shape(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return response_shape(value[0]) if value else {}
+    return None
+
+PR_NODE = {
+    'url': 'https://github.com/o/r/pull/1',
+    'title': 'Add feature',
+    'updatedAt': '2024-08-02T00:00:00Z',
+    'author': {'login': 'alice'},
+    'additions': 10,
+    'deletions': 4,
+    'changedFiles': 3,
+    'comments': {'totalCount': 2},
+    'reviews': {'totalCount': 5},
+}
+
+REVIEW_NODE = {
+    'author': {'login': 'bob'},
+    'state': 'CHANGES_REQUESTED',
+    'createdAt': '2024-08-03T10:00:00Z',
+    'body': '  Needs tests.\n',
+    'comments': {
+        'totalCount': 2,
+        'nodes': [
+            {'body': 'Nit: rename', 'createdAt': '2024-08-03T10:01:00Z'},
+            {'body': ' Missing check \n', 'createdAt': '2024-08-03T10:02:00Z'},
+        ],
+    },
+}
+
+REVIEW_COUNT_NODE = {
+    'author': {'login': 'bob'},
+    'state': 'APPROVED',
+    'createdAt': '2024-08-04T09:30:00Z',
+    'comments': {'totalCount': 3},
+}
+
+class TrimmedFieldsTest(unittest.TestCase):
+    """The fixtures carry exactly the fields the trimmed queries select."""
+
+    def test_pr_fields(self):
+        self.assertEqual(response_shape(PR_NODE), fragment_shape(fetch.PR_QUERY, 'PRFields'))
+
+    def test_review_fields(self):
+        self.assertEqual(response_shape(REVIEW_NODE), fragment_shape(fetch.REVIEWS_QUERY_FULL, 'ReviewFields'))
+
+    def test_review_count_fields(self):
+        self.assertEqual(
+            response_shape(REVIEW_COUNT_NODE), fragment_shape(fetch.REVIEWS_QUERY_COUNTS, 'ReviewFields')
+        )
+
+class ParseResponseTest(unittest.TestCase):
+    """Trimmed responses convert to the dataclasses the reports read."""
+
+    def setUp(self):
+        self.fetcher = fetch.GitHubDataFetcher(github_client=None)
+
+    def test_reviews_with_bodies(self):
+        pr = self.fetcher._build_pr_with_reviews(PR_NODE, [REVIEW_NODE], 'bob')
+
+        self.assertEqual(pr.title, 'Add feature')
+        self.assertEqual(pr.url, 'https://github.com/o/r/pull/1')
+        self.assertEqual(pr.total_comments, 2)
+        review, = pr.reviews
+        self.assertEqual(review.state, 'CHANGES_REQUESTED')
+        self.assertEqual(review.created_at, datetime(2024, 8, 3, 10, 0, tzinfo=timezone.utc))
+        self.assertEqual(review.body, 'Needs tests.')
+        self.assertEqual(review.comment_count, 2)
+        self.assertEqual(review.author, 'bob')
+        self.assertEqual([comment.body for comment in review.comments], ['Nit: rename', 'Missing check'])
+        self.assertEqual(review.comments[1].created_at, datetime(2024, 8, 3, 10, 2, tzinfo=timezone.utc))
+
+    def test_reviews_without_bodies(self):
+        pr = self.fetcher._build_pr_with_reviews(PR_NODE, [REVIEW_COUNT_NODE], 'bob')
+
+        review, = pr.reviews
+        self.assertEqual(review.state, 'APPROVED')
+        self.assertEqual(review.body, '')
+        self.assertEqual(review.comments, [])
+        self.assertEqual(review.comment_count, 3)
+        self.assertEqual(pr.total_comments, 3)
+
+    def test_member_summary(self):
+        other = dict(PR_NODE, url='https://github.com/o/r/pull/2', additions=1, deletions=0,
+                     changedFiles=1, comments={'totalCount': 9}, reviews={'totalCount': 0})
+        reviewed = self.fetcher._build_pr_with_reviews(PR_NODE, [REVIEW_NODE, REVIEW_COUNT_NODE], 'bob')
+
+        summary = fetch.ActivityAnalyzer.generate_member_summary(
+            {'name': 'Alice A', 'github': 'alice'}, [PR_NODE, other], [reviewed]
+        )
+
+        self.assertEqual(summary.authored_prs, 2)
+        self.assertEqual(summary.total_additions, 11)
+        self.assertEqual(summary.total_deletions, 4)
+        self.assertEqual(summary.total_files_changed, 4)
+        self.assertEqual(summary.reviews_given, 2)
+        self.assertEqual(summary.total_review_comments, 5)
+        self.assertEqual([pr['url'] for pr in summary.top_prs], [other['url'], PR_NODE['url']])
+        self.assertEqual(summary.most_engaged_reviews, [reviewed])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,60 @@
+"""Tests for the printed member summary."""
+import contextlib
+import io
+import os
+import unittest
+from datetime import datetime, timezone
+
+os.environ.setdefault("GITHUB_API_TOKEN", "test-token")
+
+from fetch import Comment, PRWithReviews, ReportFormatter, Review, TeamMemberSummary
+
+CREATED = datetime(2024, 8, 3, 10, 0, tzinfo=timezone.utc)
+
+def make_summary(with_bodies: bool) -> TeamMemberSummary:
+    """Build a summary with one reviewed PR, with or without review text."""
+    review = Review(
+        state='COMMENTED',
+        created_at=CREATED,
+        body='Needs tests.' if with_bodies else '',
+        comment_count=1,
+        author='bob',
+        comments=[Comment(body='Nit: rename', created_at=CREATED)] if with_bodies else [],
+    )
+    pr = PRWithReviews(title='Add feature', url='https://github.com/o/r/pull/1', reviews=[review], total_comments=1)
+    return TeamMemberSummary(
+        name='Bob B',
+        github_username='bob',
+        reviews_given=1,
+        total_review_comments=1,
+        most_engaged_reviews=[pr],
+        all_reviewed_prs=[pr],
+    )
+
+def render(summary: TeamMemberSummary, detailed: bool) -> str:
+    """Capture the printed summary."""
+    out = io.StringIO()
+    with contextlib.redirect_stdout(out):
+        ReportFormatter.print_member_summary(summary, detailed=detailed)
+    return out.getvalue()
+
+class MemberSummaryTest(unittest.TestCase):
+    """Review details are printed only when their text was fetched."""
+
+    def test_default_summary_shows_only_counts(self):
+        output = render(make_summary(with_bodies=False), detailed=False)
+
+        self.assertIn('Top 10 Most Engaged Reviews:\n• Add feature\n  https://github.com/o/r/pull/1\n'
+                      '  1 comments across 1 reviews\n', output)
+        self.assertNotIn('Review on', output)
+        self.assertNotIn('All Reviewed PRs with Comments', output)
+
+    def test_detailed_summary_shows_review_text(self):
+        output = render(make_summary(with_bodies=True), detailed=True)
+
+        self.assertIn('    Review on 2024-08-03 10:00:00 - COMMENTED\n    Review comment: Needs tests.\n', output)
+        self.assertIn('    Detailed comments:\n      [2024-08-03 10:00:00]\n      Nit: rename\n', output)
+        self.assertIn('All Reviewed PRs with Comments:', output)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,212 @@
+"""Tests for the watermarks kept between runs for incremental fetches."""
+import asyncio
+import os
+import tempfile
+import unittest
+
+os.environ.setdefault("GITHUB_API_TOKEN", "test-token")
+
+from fetch import GitHubDataFetcher, LookbackState
+
+KEY = LookbackState.make_key('prs', 'alice', 'o/r', '2024-07-01', '2025-01-31')
+
+def node(number: int, updated_at: str, **fields) -> dict:
+    """Build a stored PR node."""
+    return {'url': f'https://github.com/o/r/pull/{number}', 'updatedAt': updated_at, **fields}
+
+class FakeClient:
+    """Stands in for GitHubClient, answering every search with fixed pages."""
+
+    def __init__(self, pages):
+        self.pages = pages
+        self.queries = []
+
+    async def execute_query(self, query, variables=None, cache_ttl=None):
+        self.queries.append(variables)
+        return {'search': self.pages[len(self.queries) - 1]}
+
+class LookbackStateTest(unittest.TestCase):
+    """Watermarks advance with the stored nodes and survive a reload."""
+
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.path = os.path.join(tmp.name, 'state.json')
+
+    def test_store_sets_latest_update_as_watermark(self):
+        state = LookbackState(self.path)
+        state.store(KEY, [node(1, '2024-08-01T00:00:00Z'), node(2, '2024-09-01T00:00:00Z')])
+
+        self.assertEqual(state.watermark(KEY), '2024-09-01T00:00:00Z')
+
+    def test_empty_result_gets_run_start_as_watermark(self):
+        state = LookbackState(self.path)
+        state.store(KEY, [])
+
+        self.assertEqual(state.watermark(KEY), state.started_at)
+        self.assertEqual(state.stored_nodes(KEY), [])
+
+    def test_merge_replaces_changed_nodes(self):
+        state = LookbackState(self.path)
+        state.store(KEY, [node(1, '2024-08-01T00:00:00Z', title='old'), node(2, '2024-08-02T00:00:00Z')])
+
+        merged = state.merge(KEY, [node(1, '2024-10-01T00:00:00Z', title='new')])
+
+        self.assertEqual([(n['url'][-1], n.get('title')) for n in merged], [('1', 'new'), ('2', None)])
+        self.assertEqual(state.watermark(KEY), '2024-10-01T00:00:00Z')
+
+    def test_full_refresh_ignores_stored_entries(self):
+        state = LookbackState(self.path)
+        state.store(KEY, [node(1, '2024-08-01T00:00:00Z')])
+        state.save()
+
+        refreshed = LookbackState(self.path, full_refresh=True)
+        self.assertIsNone(refreshed.watermark(KEY))
+        self.assertEqual(refreshed.stored_nodes(KEY), [])
+
+    def test_save_and_reload(self):
+        state = LookbackState(self.path)
+        state.store(KEY, [node(1, '2024-08-01T00:00:00Z')])
+        state.save()
+
+        reloaded = LookbackState(self.path)
+        self.assertEqual(reloaded.watermark(KEY), '2024-08-01T00:00:00Z')
+        self.assertEqual(reloaded.stored_nodes(KEY), [node(1, '2024-08-01T00:00:00Z')])
+
+class IncrementalSearchTest(unittest.TestCase):
+    """Searches narrow to recent changes once every author has a watermark."""
+
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.state = LookbackState(os.path.join(tmp.name, 'state.json'))
+
+    def pr_searches(self, usernames):
+        fetcher = GitHubDataFetcher(github_client=None, state=self.state)
+        return fetcher._build_pr_searches(usernames, 'o/r', '2024-07-01', '2025-01-31')
+
+    def test_inactive_member_keeps_search_incremental(self):
+        usernames = ['alice', 'bob', 'idle']
+        _, state_keys, _ = self.pr_searches(usernames)
+        self.state.store(state_keys['alice'], [node(1, '2024-08-01T00:00:00Z')])
+        self.state.store(state_keys['bob'], [node(2, '2024-09-01T00:00:00Z')])
+        self.state.store(state_keys['idle'], [])
+
+        (search_query,), _, incremental = self.pr_searches(usernames)
+
+        self.assertEqual(incremental, set(usernames))
+        self.assertIn('updated:>=2024-08-01T00:00:00+00:00', search_query)
+
+    def test_member_without_watermark_runs_full_search(self):
+        _, state_keys, _ = self.pr_searches(['alice', 'bob'])
+        self.state.store(state_keys['alice'], [node(1, '2024-08-01T00:00:00Z')])
+
+        (search_query,), _, incremental = self.pr_searches(['alice', 'bob'])
+
+        self.assertEqual(incremental, set())
+        self.assertNotIn('updated:', search_query)
+
+    def test_review_export_leaves_state_alone(self):
+        review = {
+            'author': {'login': 'bob'}, 'state': 'COMMENTED', 'createdAt': '2024-08-03T10:00:00Z',
+            'body': 'ok', 'comments': {'totalCount': 0, 'nodes': []},
+        }
+        pr = {
+            'id': 'PR1', 'title': 'T', 'url': 'https://github.com/o/r/pull/1',
+            'updatedAt': '2024-08-03T10:00:00Z', 'author': {'login': 'alice'},
+            'reviews': {'totalCount': 1, 'pageInfo': {'hasNextPage': False, 'endCursor': None}, 'nodes': [review]},
+        }
+        client = FakeClient([{'nodes': [pr], 'pageInfo': {'hasNextPage': False, 'endCursor': None}}])
+        fetcher = GitHubDataFetcher(client, self.state)
+
+        async def export():
+            return [pr async for pr in fetcher.iter_user_reviews('bob', 'o/r', '2024-07-01', '2025-01-31')]
+
+        exported = asyncio.run(export())
+
+        self.assertEqual([pr.url for pr in exported], ['https://github.com/o/r/pull/1'])
+        self.assertEqual(self.state._load(), {})
+
+    def test_review_updated_past_end_date_is_dropped(self):
+        review = {
+            'author': {'login': 'bob'}, 'state': 'APPROVED', 'createdAt': '2024-08-03T10:00:00Z',
+            'comments': {'totalCount': 0},
+        }
+        key = LookbackState.make_key('review-counts', 'bob', 'o/r', '2024-07-01', '2025-01-31')
+        self.state.store(key, [
+            node(1, '2024-08-03T10:00:00Z', title='T', reviews=[review]),
+            node(2, '2024-08-04T10:00:00Z', title='T', reviews=[review]),
+        ])
+        pr = {
+            'id': 'PR1', 'title': 'T', 'url': 'https://github.com/o/r/pull/1',
+            'updatedAt': '2025-02-10T00:00:00Z', 'author': {'login': 'alice'},
+            'reviews': {'totalCount': 1, 'pageInfo': {'hasNextPage': False, 'endCursor': None}, 'nodes': [review]},
+        }
+        client = FakeClient([{'nodes': [pr], 'pageInfo': {'hasNextPage': False, 'endCursor': None}}])
+        fetcher = GitHubDataFetcher(client, self.state)
+
+        reviews = asyncio.run(fetcher.fetch_user_reviews(
+            'bob', 'o/r', '2024-07-01', '2025-01-31', include_bodies=False
+        ))
+
+        self.assertEqual([pr.url for pr in reviews], ['https://github.com/o/r/pull/2'])
+        self.assertNotIn('updated:<=', client.queries[0]['searchQuery'])
+
+class TruncatedSearchTest(unittest.TestCase):
+    """A search cut off at the page limit leaves no watermark behind."""
+
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.state = LookbackState(os.path.join(tmp.name, 'state.json'))
+
+    @staticmethod
+    def endless_pages(make_node, count):
+        return [
+            {'issueCount': 5000, 'nodes': [make_node(i)], 'pageInfo': {'hasNextPage': True, 'endCursor': f'c{i}'}}
+            for i in range(count)
+        ]
+
+    def test_truncated_pr_search_drops_watermark(self):
+        fetcher = GitHubDataFetcher(None, self.state)
+        _, state_keys, _ = fetcher._build_pr_searches(['alice'], 'o/r', '2024-07-01', '2025-01-31')
+        self.state.store(state_keys['alice'], [node(1, '2024-08-01T00:00:00Z', author={'login': 'alice'})])
+        pages = self.endless_pages(
+            lambda i: node(100 + i, '2024-09-01T00:00:00Z', author={'login': 'alice'}), 10
+        )
+
+        class Client(FakeClient):
+            async def execute_batch(self, queries, cache_ttl=None):
+                return [await self.execute_query(query, variables) for query, variables in queries]
+
+        fetcher.github_client = Client(pages)
+        with self.assertLogs('fetch', 'WARNING'):
+            prs_by_user = asyncio.run(fetcher.fetch_team_prs(['alice'], 'o/r', '2024-07-01', '2025-01-31'))
+
+        self.assertEqual(len(prs_by_user['alice']), 11)
+        self.assertIsNone(self.state.watermark(state_keys['alice']))
+
+    def test_truncated_review_search_drops_watermark(self):
+        review = {
+            'author': {'login': 'bob'}, 'state': 'APPROVED', 'createdAt': '2024-08-03T10:00:00Z',
+            'comments': {'totalCount': 0},
+        }
+        pages = self.endless_pages(lambda i: {
+            'id': f'PR{i}', 'title': 'T', 'url': f'https://github.com/o/r/pull/{i}',
+            'updatedAt': '2024-09-01T00:00:00Z', 'author': {'login': 'alice'},
+            'reviews': {'totalCount': 1, 'pageInfo': {'hasNextPage': False, 'endCursor': None}, 'nodes': [review]},
+        }, 10)
+        fetcher = GitHubDataFetcher(FakeClient(pages), self.state)
+        key = LookbackState.make_key('review-counts', 'bob', 'o/r', '2024-07-01', '2025-01-31')
+        self.state.store(key, [node(1, '2024-08-01T00:00:00Z', title='T', reviews=[review])])
+
+        with self.assertLogs('fetch', 'WARNING'):
+            reviews = asyncio.run(fetcher.fetch_user_reviews(
+                'bob', 'o/r', '2024-07-01', '2025-01-31', include_bodies=False
+            ))
+
+        self.assertEqual(len(reviews), 10)
+        self.assertIsNone(self.state.watermark(key))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,50 @@
+"""Tests for fetching a whole team's PRs and reviews together."""
+import asyncio
+import os
+import unittest
+
+os.environ.setdefault("GITHUB_API_TOKEN", "test-token")
+
+import fetch
+from fetch import GitHubAPIError, GitHubDataFetcher
+
+EMPTY_SEARCH = {'issueCount': 0, 'nodes': [], 'pageInfo': {'hasNextPage': False, 'endCursor': None}}
+
+class FakeClient:
+    """Answers every search with no results, failing review searches for ``failing_user``."""
+
+    def __init__(self, failing_user: str):
+        self.failing_user = failing_user
+
+    async def execute_batch(self, queries, cache_ttl=None):
+        return [{'search': await self.search(variables['searchQuery'])} for _, variables in queries]
+
+    async def execute_query(self, query, variables=None, cache_ttl=None):
+        return {'search': await self.search(variables['searchQuery'])}
+
+    async def search(self, search_query: str) -> dict:
+        if f'reviewed-by:{self.failing_user} ' in search_query:
+            raise GitHubAPIError('GraphQL query failed: boom')
+        return EMPTY_SEARCH
+
+class TeamActivityTest(unittest.TestCase):
+    """A failed review fetch fails the whole run, as a failed PR fetch does."""
+
+    def fetch_activity(self, client):
+        fetcher = GitHubDataFetcher(client)
+        return asyncio.run(fetcher.fetch_team_activity(['alice', 'bob'], 'o/r', '2024-07-01', '2025-01-31'))
+
+    def test_review_failure_is_raised(self):
+        with self.assertLogs(fetch.logger, 'ERROR') as logs:
+            with self.assertRaisesRegex(GitHubAPIError, 'boom'):
+                self.fetch_activity(FakeClient(failing_user='bob'))
+        self.assertTrue(any('Error fetching reviews for bob' in line for line in logs.output))
+
+    def test_results_keyed_by_user(self):
+        prs_by_user, reviews_by_user = self.fetch_activity(FakeClient(failing_user='nobody'))
+
+        self.assertEqual(reviews_by_user, {'alice': [], 'bob': []})
+        self.assertEqual(prs_by_user['alice'], [])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,73 @@
+"""Tests for fetching several authors' PRs through shared searches."""
+import asyncio
+import os
+import re
+import unittest
+
+os.environ.setdefault("GITHUB_API_TOKEN", "test-token")
+
+import fetch
+from fetch import GitHubDataFetcher
+
+class FakeClient:
+    """Answers PR searches with one PR per author, reporting ``issue_count`` for shared searches."""
+
+    def __init__(self, issue_count: int):
+        self.issue_count = issue_count
+        self.searches = []
+
+    def search(self, search_query: str) -> dict:
+        self.searches.append(search_query)
+        authors = re.findall(r'author:(\S+)', search_query)
+        return {
+            'issueCount': self.issue_count if len(authors) > 1 else len(authors),
+            'nodes': [
+                {'url': f'https://github.com/o/r/pull/{i}', 'author': {'login': author}}
+                for i, author in enumerate(authors)
+            ],
+            'pageInfo': {'hasNextPage': False, 'endCursor': None},
+        }
+
+    async def execute_batch(self, queries, cache_ttl=None):
+        return [{'search': self.search(variables['searchQuery'])} for _, variables in queries]
+
+class TeamPRSearchTest(unittest.TestCase):
+    """Authors share searches until one would pass GitHub's result cap."""
+
+    def fetch_prs(self, client, usernames):
+        fetcher = GitHubDataFetcher(client)
+        return asyncio.run(fetcher.fetch_team_prs(usernames, 'o/r', '2024-07-01', '2025-01-31'))
+
+    def test_authors_share_a_search(self):
+        client = FakeClient(issue_count=2)
+
+        prs_by_user = self.fetch_prs(client, ['alice', 'bob'])
+
+        self.assertEqual(len(client.searches), 1)
+        self.assertEqual({user: len(prs) for user, prs in prs_by_user.items()}, {'alice': 1, 'bob': 1})
+
+    def test_search_over_cap_splits_per_author(self):
+        client = FakeClient(issue_count=fetch.SEARCH_RESULT_LIMIT + 1)
+
+        with self.assertLogs(fetch.logger, 'INFO') as logs:
+            prs_by_user = self.fetch_prs(client, ['alice', 'bob'])
+
+        self.assertEqual(len(client.searches), 3)
+        self.assertEqual([re.findall(r'author:(\S+)', search) for search in client.searches[1:]],
+                         [['alice'], ['bob']])
+        self.assertEqual({user: len(prs) for user, prs in prs_by_user.items()}, {'alice': 1, 'bob': 1})
+        self.assertTrue(any('searching per author' in line for line in logs.output))
+
+    def test_truncated_pagination_warns(self):
+        async def query_page(cursor):
+            return [{}], True, 'next'
+
+        async def pages():
+            return [items async for items in GitHubDataFetcher(None)._iter_pages(query_page, max_pages=3)]
+
+        with self.assertLogs(fetch.logger, 'WARNING') as logs:
+            self.assertEqual(len(asyncio.run(pages())), 3)
+        self.assertTrue(any('more results remaining' in line for line in logs.output))
+
+if __name__ == '__main__':
+    unittest.main()